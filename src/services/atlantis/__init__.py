@@ -1,5 +1,20 @@
 """Atlantis service module."""
 
+from importlib.util import find_spec
+
 from .atlantis import AtlantisService
 
 __all__ = ["AtlantisService"]
+
+# aiohttp is an optional dependency and slow to import, so the async service
+# is only loaded when accessed
+if find_spec("aiohttp") is not None:
+    __all__.append("AsyncAtlantisService")
+
+
+def __getattr__(name):
+    if name == "AsyncAtlantisService":
+        from .atlantis_async import AsyncAtlantisService
+
+        return AsyncAtlantisService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
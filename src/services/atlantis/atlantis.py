@@ -5,9 +5,95 @@ Atlantis is a tool for automating Terraform workflows via pull requests.
 This service provides a Python interface to interact with the Atlantis API.
 """
 
-import requests
-from typing import Optional, Dict, Any, List
-from requests.auth import HTTPBasicAuth
+import copy
+import json
+import time
+from functools import cached_property
+from typing import Optional, Dict, Any, List, Hashable, Literal, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+_JSON_CONTENT_TYPE = {"Content-Type": "application/json"}
+
+# API endpoints, relative to the "/api" prefix
+_EP_PROJECTS = "/projects"
+_EP_PROJECT = "/project"
+_EP_PROJECT_STATUS = "/project/status"
+_EP_LOCKS = "/locks"
+_EP_EVENTS = "/events"
+_EP_VERSION = "/version"
+_EP_HEALTH = "/health"
+_EP_PLAN = "/plan"
+_EP_APPLY = "/apply"
+
+_ACTION_ENDPOINTS = {"plan": _EP_PLAN, "apply": _EP_APPLY}
+
+# requests is imported on first use since it is slow to import
+_requests = None
+
+
+def _get_requests():
+    """Import and return the requests module on first use."""
+    global _requests
+    if _requests is None:
+        import requests
+
+        _requests = requests
+    return _requests
+
+
+def _params(**kwargs: Any) -> Dict[str, Any]:
+    """Build a query parameter dict, dropping arguments that are None."""
+    return {key: value for key, value in kwargs.items() if value is not None}
+
+
+# Default TTLs (seconds) for GET endpoints whose data rarely changes
+_DEFAULT_CACHE_TTL = {
+    _EP_VERSION: 3600,
+    _EP_HEALTH: 10,
+    _EP_PROJECTS: 30,
+}
+
+
+class _TTLCache:
+    """Minimal in-process cache whose entries expire after a per-entry TTL."""
+
+    def __init__(self):
+        self._entries: Dict[Hashable, tuple] = {}
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            # Another thread may have dropped it already
+            self._entries.pop(key, None)
+            return None
+
+        # Hand out a copy so callers can't mutate the cached value
+        return copy.deepcopy(value)
+
+    def set(self, key: Hashable, value: Dict[str, Any], ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, copy.deepcopy(value))
+
+    def clear(self) -> None:
+        self._entries.clear()
 
 
 class AtlantisService:
@@ -25,6 +111,8 @@ class AtlantisService:
         token: Optional[str] = None,
         verify_ssl: bool = True,
         timeout: int = 30,
+        cache_ttl: Optional[Dict[str, float]] = None,
+        transport: Literal["requests", "httpx"] = "requests",
     ):
         """
         Initialize the Atlantis Service.
@@ -36,9 +124,16 @@ class AtlantisService:
             token: API token for authentication (optional if username/password are provided)
             verify_ssl: Whether to verify SSL certificates (default: True)
             timeout: Request timeout in seconds (default: 30)
+            cache_ttl: Mapping of endpoint to cache TTL in seconds for GET requests
+                       (optional, defaults to caching version, health and projects).
+                       Pass an empty dict to disable caching.
+            transport: HTTP client backing the service - "requests" (default) or
+                       "httpx", which uses HTTP/2 and disables response compression.
+                       The "httpx" transport requires the 'http2' extra.
 
         Raises:
-            ValueError: If neither authentication method is provided
+            ValueError: If neither authentication method is provided or the
+                        transport is not supported
         """
         if not base_url:
             raise ValueError("base_url is required")
@@ -48,21 +143,126 @@ class AtlantisService:
                 "Either username/password or token must be provided for authentication"
             )
 
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unsupported transport: {transport}")
+
         self.base_url = base_url.rstrip("/")
+        self._api_base = self.base_url + "/api"
         self.timeout = timeout
         self.verify_ssl = verify_ssl
+        self.transport = transport
+        self.cache_ttl = dict(_DEFAULT_CACHE_TTL if cache_ttl is None else cache_ttl)
+        self._cache = _TTLCache()
 
-        # Set up authentication
-        self.auth = None
-        self.headers = {}
+        # Set up authentication; the auth object and HTTP client are only
+        # materialized on first use
+        self._username = username
+        self._password = password
+        self._token = token
+        self.headers = {"Accept": "application/json"}
 
         if token:
             # For plan/apply endpoints, use X-Atlantis-Token header
             # For other endpoints, Bearer token may also work
             self.headers["X-Atlantis-Token"] = token
             self.headers["Authorization"] = f"Bearer {token}"
-        elif username and password:
-            self.auth = HTTPBasicAuth(username, password)
+
+    @cached_property
+    def auth(self) -> Optional["requests.auth.HTTPBasicAuth"]:
+        """HTTP basic auth object, or None when token authentication is used."""
+        if self._token or not (self._username and self._password):
+            return None
+        return _get_requests().auth.HTTPBasicAuth(self._username, self._password)
+
+    @cached_property
+    def _session(self) -> "requests.Session":
+        """
+        Pooled requests session sharing this service's configuration.
+
+        A single session is reused so connections are kept alive and pooled.
+        """
+        requests = _get_requests()
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        session = requests.Session()
+        session.headers.update(self.headers)
+        session.auth = self.auth
+        session.verify = self.verify_ssl
+
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(429, 502, 503, 504),
+            ),
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        return session
+
+    @cached_property
+    def _client(self) -> "httpx.Client":
+        """
+        HTTP/2 httpx client sharing this service's configuration.
+
+        Raises:
+            ImportError: If httpx (with HTTP/2 support) is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "httpx is required for transport='httpx' "
+                "(install with the 'http2' extra)"
+            ) from e
+
+        auth = None
+        if not self._token and self._username and self._password:
+            auth = (self._username, self._password)
+
+        # Responses are small JSON bodies, so skip compression entirely
+        return httpx.Client(
+            headers={**self.headers, "Accept-Encoding": "identity"},
+            auth=auth,
+            verify=self.verify_ssl,
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+
+    def close(self) -> None:
+        """
+        Close the underlying HTTP session and release pooled connections.
+
+        Example:
+            >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
+            >>> service.close()
+        """
+        # Only close clients that were actually created
+        for name in ("_client", "_session"):
+            client = self.__dict__.pop(name, None)
+            if client is not None:
+                client.close()
+
+    def clear_cache(self) -> None:
+        """
+        Drop all cached GET responses.
+
+        Example:
+            >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
+            >>> service.clear_cache()
+        """
+        self._cache.clear()
+
+    def __enter__(self) -> "AtlantisService":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _make_request(
         self,
@@ -70,42 +270,84 @@ class AtlantisService:
         endpoint: str,
         params: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
+        expect_body: bool = True,
     ) -> Dict[str, Any]:
         """
         Make an HTTP request to the Atlantis API.
 
+        GET requests to endpoints listed in cache_ttl are served from the
+        in-process cache while the cached response is still fresh.
+
         Args:
             method: HTTP method (GET, POST, DELETE, etc.)
-            endpoint: API endpoint (e.g., '/api/projects')
+            endpoint: API endpoint relative to '/api' (e.g., '/projects')
             params: Query parameters
             json_data: JSON body data
+            expect_body: Whether the response body is needed (default: True).
+                         When False the body is streamed and discarded unread.
 
         Returns:
-            Response JSON as dictionary
+            Response JSON as dictionary (empty if expect_body is False)
 
         Raises:
             requests.exceptions.RequestException: If the request fails
+            httpx.HTTPError: If the request fails using the httpx transport
         """
-        url = f"{self.base_url}{endpoint}"
+        ttl = self.cache_ttl.get(endpoint) if method == "GET" else None
+        if ttl:
+            cache_key = (
+                method,
+                endpoint,
+                frozenset(params.items()) if params else None,
+            )
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-        response = requests.request(
-            method=method,
-            url=url,
-            params=params,
-            json=json_data,
-            auth=self.auth,
-            headers=self.headers,
-            verify=self.verify_ssl,
-            timeout=self.timeout,
-        )
+        url = self._api_base + endpoint
 
-        response.raise_for_status()
+        # Encode the body ourselves so orjson is used when available
+        body = headers = None
+        if json_data is not None:
+            body = _json_dumps(json_data)
+            headers = _JSON_CONTENT_TYPE
+
+        if self.transport == "httpx":
+            request = self._client.build_request(
+                method, url, params=params, content=body, headers=headers
+            )
+            response = self._client.send(request, stream=not expect_body)
+        else:
+            response = self._session.request(
+                method=method,
+                url=url,
+                params=params,
+                data=body,
+                headers=headers,
+                timeout=self.timeout,
+                stream=not expect_body,
+            )
 
-        # Handle empty responses
-        if response.status_code == 204 or not response.text:
+        if not expect_body:
+            try:
+                response.raise_for_status()
+            finally:
+                response.close()
             return {}
 
-        return response.json()
+        response.raise_for_status()
+
+        # Handle empty responses; parse raw bytes to skip text decoding
+        content = response.content
+        if response.status_code == 204 or not content:
+            result = {}
+        else:
+            result = _json_loads(content)
+
+        if ttl:
+            self._cache.set(cache_key, result, ttl)
+
+        return result
 
     def get_projects(self) -> List[Dict[str, Any]]:
         """
@@ -118,7 +360,7 @@ class AtlantisService:
             >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
             >>> projects = service.get_projects()
         """
-        response = self._make_request("GET", "/api/projects")
+        response = self._make_request("GET", _EP_PROJECTS)
         return response.get("projects", [])
 
     def get_project(
@@ -139,13 +381,9 @@ class AtlantisService:
             >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
             >>> project = service.get_project(repo="owner/repo", project="default")
         """
-        params = {"repo": repo}
-        if project:
-            params["project"] = project
-        if branch:
-            params["branch"] = branch
+        params = _params(repo=repo, project=project, branch=branch)
 
-        response = self._make_request("GET", "/api/project", params=params)
+        response = self._make_request("GET", _EP_PROJECT, params=params)
         return response
 
     def get_project_status(
@@ -162,13 +400,9 @@ class AtlantisService:
         Returns:
             Status dictionary containing locks, plans, and applies
         """
-        params = {"repo": repo}
-        if project:
-            params["project"] = project
-        if branch:
-            params["branch"] = branch
+        params = _params(repo=repo, project=project, branch=branch)
 
-        response = self._make_request("GET", "/api/project/status", params=params)
+        response = self._make_request("GET", _EP_PROJECT_STATUS, params=params)
         return response
 
     def get_locks(self, repo: Optional[str] = None) -> List[Dict[str, Any]]:
@@ -185,11 +419,9 @@ class AtlantisService:
             >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
             >>> locks = service.get_locks(repo="owner/repo")
         """
-        params = {}
-        if repo:
-            params["repo"] = repo
+        params = _params(repo=repo)
 
-        response = self._make_request("GET", "/api/locks", params=params)
+        response = self._make_request("GET", _EP_LOCKS, params=params)
         return response.get("locks", [])
 
     def delete_lock(
@@ -204,19 +436,18 @@ class AtlantisService:
             project: Project name (optional, for validation)
 
         Returns:
-            Response dictionary
+            Dictionary confirming the deleted lock ID
 
         Example:
             >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
             >>> service.delete_lock(lock_id="abc-123")
+            {'ok': True, 'id': 'abc-123'}
         """
-        params = {"id": lock_id}
-        if repo:
-            params["repo"] = repo
-        if project:
-            params["project"] = project
+        params = _params(id=lock_id, repo=repo, project=project)
 
-        return self._make_request("DELETE", "/api/locks", params=params)
+        # The response body is never used, so don't read or parse it
+        self._make_request("DELETE", _EP_LOCKS, params=params, expect_body=False)
+        return {"ok": True, "id": lock_id}
 
     def get_events(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
@@ -232,11 +463,9 @@ class AtlantisService:
             >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
             >>> events = service.get_events(limit=10)
         """
-        params = {}
-        if limit:
-            params["limit"] = limit
+        params = _params(limit=limit)
 
-        response = self._make_request("GET", "/api/events", params=params)
+        response = self._make_request("GET", _EP_EVENTS, params=params)
         return response.get("events", [])
 
     def get_version(self) -> Dict[str, Any]:
@@ -250,7 +479,7 @@ class AtlantisService:
             >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
             >>> version = service.get_version()
         """
-        return self._make_request("GET", "/api/version")
+        return self._make_request("GET", _EP_VERSION)
 
     def get_health(self) -> Dict[str, Any]:
         """
@@ -263,7 +492,42 @@ class AtlantisService:
             >>> service = AtlantisService(base_url="https://atlantis.example.com", token="abc123")
             >>> health = service.get_health()
         """
-        return self._make_request("GET", "/api/health")
+        return self._make_request("GET", _EP_HEALTH)
+
+    def _submit(
+        self,
+        action: str,
+        repository: str,
+        ref: str,
+        vcs_type: str,
+        paths: List[Dict[str, str]],
+        pr_number: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Submit a plan or apply operation to Atlantis.
+
+        Args:
+            action: Operation to run - "plan" or "apply"
+            repository: Repository identifier (e.g., 'owner/repo')
+            ref: Git reference (branch name or commit SHA)
+            vcs_type: VCS provider type (e.g., 'Github', 'Gitlab', 'Bitbucket')
+            paths: List of dictionaries specifying directories and workspaces
+            pr_number: Pull request number (optional)
+
+        Returns:
+            Response dictionary from Atlantis API
+        """
+        payload = {
+            "Repository": repository,
+            "Ref": ref,
+            "Type": vcs_type,
+            "Paths": paths,
+        }
+
+        if pr_number is not None:
+            payload["PR"] = pr_number
+
+        return self._make_request("POST", _ACTION_ENDPOINTS[action], json_data=payload)
 
     def plan(
         self,
@@ -306,17 +570,9 @@ class AtlantisService:
             Requires Atlantis to be configured with an api-secret for authentication.
             The token parameter in __init__ should be set to the API secret.
         """
-        payload = {
-            "Repository": repository,
-            "Ref": ref,
-            "Type": vcs_type,
-            "Paths": paths,
-        }
-
-        if pr_number is not None:
-            payload["PR"] = pr_number
-
-        return self._make_request("POST", "/api/plan", json_data=payload)
+        return self._submit(
+            "plan", repository, ref, vcs_type, paths, pr_number=pr_number
+        )
 
     def apply(
         self,
@@ -359,14 +615,6 @@ class AtlantisService:
             Requires Atlantis to be configured with an api-secret for authentication.
             The token parameter in __init__ should be set to the API secret.
         """
-        payload = {
-            "Repository": repository,
-            "Ref": ref,
-            "Type": vcs_type,
-            "Paths": paths,
-        }
-
-        if pr_number is not None:
-            payload["PR"] = pr_number
-
-        return self._make_request("POST", "/api/apply", json_data=payload)
+        return self._submit(
+            "apply", repository, ref, vcs_type, paths, pr_number=pr_number
+        )
@@ -0,0 +1,385 @@
+"""
+Async Atlantis Service - asyncio client for interacting with Atlantis API.
+
+This service mirrors AtlantisService on top of aiohttp so that many independent
+calls (e.g. plans/applies across several repositories or workspaces) can be
+dispatched concurrently on a single event loop.
+"""
+
+import asyncio
+import base64
+from typing import Optional, Dict, Any, List
+
+import aiohttp
+
+from .atlantis import (
+    _ACTION_ENDPOINTS,
+    _EP_EVENTS,
+    _EP_HEALTH,
+    _EP_LOCKS,
+    _EP_PROJECT,
+    _EP_PROJECT_STATUS,
+    _EP_PROJECTS,
+    _EP_VERSION,
+    _json_loads,
+    _params,
+)
+
+
+class AsyncAtlantisService:
+    """
+    Async service class for interacting with the Atlantis API.
+
+    Must be used as an async context manager so the underlying
+    aiohttp.ClientSession is opened and closed properly.
+
+    Atlantis API documentation: https://www.runatlantis.io/docs/api.html
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        token: Optional[str] = None,
+        verify_ssl: bool = True,
+        timeout: int = 30,
+        max_connections: int = 32,
+    ):
+        """
+        Initialize the Async Atlantis Service.
+
+        Args:
+            base_url: Base URL of the Atlantis server (e.g., 'https://atlantis.example.com')
+            username: Username for basic authentication (optional if token is provided)
+            password: Password for basic authentication (optional if token is provided)
+            token: API token for authentication (optional if username/password are provided)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+            timeout: Request timeout in seconds (default: 30)
+            max_connections: Maximum number of concurrent connections (default: 32)
+
+        Raises:
+            ValueError: If neither authentication method is provided
+        """
+        if not base_url:
+            raise ValueError("base_url is required")
+
+        if not username and not password and not token:
+            raise ValueError(
+                "Either username/password or token must be provided for authentication"
+            )
+
+        self.base_url = base_url.rstrip("/")
+        self._api_base = self.base_url + "/api"
+        self.timeout = timeout
+        self.verify_ssl = verify_ssl
+        self.max_connections = max_connections
+
+        # Set up authentication
+        self.headers = {"Accept": "application/json"}
+
+        if token:
+            self.headers["X-Atlantis-Token"] = token
+            self.headers["Authorization"] = f"Bearer {token}"
+        elif username and password:
+            # Encoded by hand since aiohttp.BasicAuth is deprecated
+            credentials = base64.b64encode(f"{username}:{password}".encode()).decode()
+            self.headers["Authorization"] = f"Basic {credentials}"
+
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncAtlantisService":
+        self._session = aiohttp.ClientSession(
+            headers=self.headers,
+            connector=aiohttp.TCPConnector(
+                limit=self.max_connections, ssl=self.verify_ssl
+            ),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        expect_body: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Make an HTTP request to the Atlantis API.
+
+        Args:
+            method: HTTP method (GET, POST, DELETE, etc.)
+            endpoint: API endpoint relative to '/api' (e.g., '/projects')
+            params: Query parameters
+            json_data: JSON body data
+            expect_body: Whether the response body is needed (default: True).
+                         When False the body is discarded unread.
+
+        Returns:
+            Response JSON as dictionary (empty if expect_body is False)
+
+        Raises:
+            RuntimeError: If the service is used outside of ``async with``
+            aiohttp.ClientResponseError: If the request fails
+        """
+        if self._session is None:
+            raise RuntimeError(
+                "AsyncAtlantisService must be used as an async context manager"
+            )
+
+        url = self._api_base + endpoint
+
+        async with self._session.request(
+            method, url, params=params, json=json_data
+        ) as response:
+            response.raise_for_status()
+
+            # Handle empty responses
+            if not expect_body or response.status == 204:
+                return {}
+
+            body = await response.read()
+            if not body:
+                return {}
+
+            return _json_loads(body)
+
+    async def get_projects(self) -> List[Dict[str, Any]]:
+        """
+        Get all projects from Atlantis.
+
+        Returns:
+            List of project dictionaries
+        """
+        response = await self._request("GET", _EP_PROJECTS)
+        return response.get("projects", [])
+
+    async def get_project(
+        self, repo: str, project: Optional[str] = None, branch: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get a specific project from Atlantis.
+
+        Args:
+            repo: Repository identifier (e.g., 'owner/repo')
+            project: Project name (optional)
+            branch: Branch name (optional)
+
+        Returns:
+            Project dictionary
+        """
+        params = _params(repo=repo, project=project, branch=branch)
+
+        return await self._request("GET", _EP_PROJECT, params=params)
+
+    async def get_project_status(
+        self, repo: str, project: Optional[str] = None, branch: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Get the status of a project (locks, plans, applies).
+
+        Args:
+            repo: Repository identifier (e.g., 'owner/repo')
+            project: Project name (optional)
+            branch: Branch name (optional)
+
+        Returns:
+            Status dictionary containing locks, plans, and applies
+        """
+        params = _params(repo=repo, project=project, branch=branch)
+
+        return await self._request("GET", _EP_PROJECT_STATUS, params=params)
+
+    async def get_locks(self, repo: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get all locks or locks for a specific repository.
+
+        Args:
+            repo: Repository identifier (optional, if not provided returns all locks)
+
+        Returns:
+            List of lock dictionaries
+        """
+        params = _params(repo=repo)
+
+        response = await self._request("GET", _EP_LOCKS, params=params)
+        return response.get("locks", [])
+
+    async def delete_lock(
+        self, lock_id: str, repo: Optional[str] = None, project: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Delete a lock by ID.
+
+        Args:
+            lock_id: Lock ID to delete
+            repo: Repository identifier (optional, for validation)
+            project: Project name (optional, for validation)
+
+        Returns:
+            Dictionary confirming the deleted lock ID
+        """
+        params = _params(id=lock_id, repo=repo, project=project)
+
+        await self._request("DELETE", _EP_LOCKS, params=params, expect_body=False)
+        return {"ok": True, "id": lock_id}
+
+    async def get_events(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Get recent events from Atlantis.
+
+        Args:
+            limit: Maximum number of events to return (optional)
+
+        Returns:
+            List of event dictionaries
+        """
+        params = _params(limit=limit)
+
+        response = await self._request("GET", _EP_EVENTS, params=params)
+        return response.get("events", [])
+
+    async def get_version(self) -> Dict[str, Any]:
+        """
+        Get Atlantis server version information.
+
+        Returns:
+            Version dictionary
+        """
+        return await self._request("GET", _EP_VERSION)
+
+    async def get_health(self) -> Dict[str, Any]:
+        """
+        Get Atlantis server health status.
+
+        Returns:
+            Health status dictionary
+        """
+        return await self._request("GET", _EP_HEALTH)
+
+    async def _submit(
+        self,
+        action: str,
+        repository: str,
+        ref: str,
+        vcs_type: str,
+        paths: List[Dict[str, str]],
+        pr_number: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Submit a plan or apply operation to Atlantis.
+
+        Args:
+            action: Operation to run - "plan" or "apply"
+            repository: Repository identifier (e.g., 'owner/repo')
+            ref: Git reference (branch name or commit SHA)
+            vcs_type: VCS provider type (e.g., 'Github', 'Gitlab', 'Bitbucket')
+            paths: List of dictionaries specifying directories and workspaces
+            pr_number: Pull request number (optional)
+
+        Returns:
+            Response dictionary from Atlantis API
+        """
+        payload = {
+            "Repository": repository,
+            "Ref": ref,
+            "Type": vcs_type,
+            "Paths": paths,
+        }
+
+        if pr_number is not None:
+            payload["PR"] = pr_number
+
+        return await self._request("POST", _ACTION_ENDPOINTS[action], json_data=payload)
+
+    async def plan(
+        self,
+        repository: str,
+        ref: str,
+        vcs_type: str,
+        paths: List[Dict[str, str]],
+        pr_number: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute a Terraform plan operation via Atlantis.
+
+        Args:
+            repository: Repository identifier (e.g., 'owner/repo')
+            ref: Git reference (branch name or commit SHA)
+            vcs_type: VCS provider type (e.g., 'Github', 'Gitlab', 'Bitbucket')
+            paths: List of dictionaries specifying directories and workspaces
+            pr_number: Pull request number (optional)
+
+        Returns:
+            Response dictionary from Atlantis API
+        """
+        return await self._submit(
+            "plan", repository, ref, vcs_type, paths, pr_number=pr_number
+        )
+
+    async def apply(
+        self,
+        repository: str,
+        ref: str,
+        vcs_type: str,
+        paths: List[Dict[str, str]],
+        pr_number: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Execute a Terraform apply operation via Atlantis.
+
+        Args:
+            repository: Repository identifier (e.g., 'owner/repo')
+            ref: Git reference (branch name or commit SHA)
+            vcs_type: VCS provider type (e.g., 'Github', 'Gitlab', 'Bitbucket')
+            paths: List of dictionaries specifying directories and workspaces
+            pr_number: Pull request number (optional)
+
+        Returns:
+            Response dictionary from Atlantis API
+        """
+        return await self._submit(
+            "apply", repository, ref, vcs_type, paths, pr_number=pr_number
+        )
+
+    async def plan_many(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several plan operations concurrently.
+
+        Args:
+            specs: List of keyword-argument dictionaries accepted by plan()
+
+        Returns:
+            List of response dictionaries, in the same order as specs
+
+        Example:
+            >>> async with AsyncAtlantisService(base_url="https://atlantis.example.com", token="abc123") as service:
+            ...     results = await service.plan_many([
+            ...         {"repository": "owner/repo1", "ref": "main", "vcs_type": "Github", "paths": paths},
+            ...         {"repository": "owner/repo2", "ref": "main", "vcs_type": "Github", "paths": paths},
+            ...     ])
+        """
+        return list(await asyncio.gather(*(self.plan(**spec) for spec in specs)))
+
+    async def apply_many(self, specs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Execute several apply operations concurrently.
+
+        Args:
+            specs: List of keyword-argument dictionaries accepted by apply()
+
+        Returns:
+            List of response dictionaries, in the same order as specs
+        """
+        return list(await asyncio.gather(*(self.apply(**spec) for spec in specs)))
@@ -1,6 +1,20 @@
 """GitHub service module."""
 
+from importlib.util import find_spec
+
 from .github import GitHubService
 
 __all__ = ["GitHubService"]
 
+# aiohttp is an optional dependency and slow to import, so the async service
+# is only loaded when accessed
+if find_spec("aiohttp") is not None:
+    __all__.append("AsyncGitHubService")
+
+
+def __getattr__(name):
+    if name == "AsyncGitHubService":
+        from .github_async import AsyncGitHubService
+
+        return AsyncGitHubService
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
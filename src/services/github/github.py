@@ -5,30 +5,251 @@ This service provides a Python interface to interact with GitHub repositories,
 pull requests, webhooks, branch protection, labels, and comments using PyGithub.
 """
 
-from typing import Optional, List, Dict, Any
-from github import Github
+import inspect
+import json
+import logging
+import threading
+import time
+import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    Callable,
+    Hashable,
+    Iterator,
+    Tuple,
+    TypeVar,
+)
+from github import Auth, Github, InputGitTreeElement
+from github.GithubRetry import GithubRetry
 from github.Repository import Repository
 from github.PullRequest import PullRequest
 from github.Branch import Branch
 from github.Label import Label
 from github.IssueComment import IssueComment
 from github.Hook import Hook
-from github.GithubException import GithubException
+from github.PaginatedList import PaginatedList
+from github.GithubException import GithubException, RateLimitExceededException
+from github.GithubObject import NotSet
+
+_T = TypeVar("_T")
+
+logger = logging.getLogger(__name__)
+
+# Maximum number of hydrated Repository objects kept per service
+_REPO_CACHE_SIZE = 128
+
+# Default lifetime in seconds of memoized branch protection and label reads
+_DEFAULT_CACHE_TTL = 30
+
+# Upper bound on concurrent blob uploads in push_files_to_branch
+_MAX_BLOB_WORKERS = 16
+
+# Pull request with its labels and comments, fetched in a single round-trip
+_PULL_REQUEST_BUNDLE_QUERY = """
+query($owner: String!, $repo: String!, $number: Int!) {
+  repository(owner: $owner, name: $repo) {
+    pullRequest(number: $number) {
+      number
+      title
+      body
+      state
+      labels(first: 100) { nodes { name color } }
+      comments(first: 100) { nodes { databaseId body author { login } } }
+    }
+  }
+}
+"""
+
+
+@dataclass
+class PullRequestBundle:
+    """A pull request together with its labels and comments."""
+
+    number: int
+    title: str
+    body: str
+    state: str
+    labels: List[Dict[str, Any]]
+    comments: List[Dict[str, Any]]
+    merged: bool = False
+
+
+class _ConditionalRequestHook:
+    """
+    Wraps a PyGithub Requester's requestJson to revalidate GETs conditionally.
+
+    GET responses carrying an ETag or Last-Modified header are cached; later
+    GETs for the same URL send If-None-Match and/or If-Modified-Since and a
+    304 Not Modified is answered from the cache. Last-Modified covers endpoints
+    whose ETags are unstable for identical content. 304s carry no body and do
+    not count against the primary rate limit.
+
+    Every response's X-RateLimit-Remaining/X-RateLimit-Reset headers are
+    recorded per X-RateLimit-Resource (core REST, search, GraphQL, ...), and
+    once fewer than min_remaining requests are left in a budget the next
+    request against it waits for the window to reset instead of tripping the
+    limit. Waits longer than max_wait seconds raise RateLimitExceededException
+    instead of blocking the caller.
+    """
+
+    def __init__(
+        self,
+        request_json: Callable[..., Tuple[int, Dict[str, Any], str]],
+        cache: Dict[
+            Tuple[str, str],
+            Tuple[Optional[str], Optional[str], Dict[str, Any], str],
+        ],
+        max_entries: int = 1024,
+        min_remaining: int = 10,
+        max_wait: float = 60.0,
+    ):
+        self._request_json = request_json
+        self.cache = cache
+        # Pool workers (prefetch_pages, blob uploads) share the cache
+        self._lock = threading.Lock()
+        self.max_entries = max_entries
+        self.min_remaining = min_remaining
+        self.max_wait = max_wait
+        # Last seen (remaining, reset epoch seconds) per rate limit resource
+        self.rate_limits: Dict[str, Tuple[int, int]] = {}
+
+    @staticmethod
+    def _resource(url: str) -> str:
+        """Return the rate limit resource a request to url is counted against."""
+        # GitHub Enterprise serves REST under /api/v3 and GraphQL at /api/graphql
+        path = urllib.parse.urlsplit(url).path.removeprefix("/api/v3")
+        if path in ("/graphql", "/api/graphql"):
+            return "graphql"
+        if path.startswith("/search/code"):
+            return "code_search"
+        if path.startswith("/search/"):
+            return "search"
+        return "core"
+
+    def _send(self, *args: Any, **kwargs: Any) -> Tuple[int, Dict[str, Any], str]:
+        url = args[1] if len(args) > 1 else kwargs["url"]
+        resource = self._resource(url)
+        rate_limit = self.rate_limits.get(resource)
+        if rate_limit is not None:
+            remaining, reset = rate_limit
+            delay = reset - time.time()
+            if remaining < self.min_remaining and delay > 0:
+                if delay > self.max_wait:
+                    raise RateLimitExceededException(
+                        403,
+                        {
+                            "message": f"{remaining} {resource} requests left; "
+                            f"rate limit resets in {delay:.0f}s "
+                            f"(max_wait={self.max_wait}s)"
+                        },
+                    )
+                logger.warning(
+                    "GitHub %s rate limit nearly exhausted (%d left); "
+                    "waiting %.1fs for reset",
+                    resource,
+                    remaining,
+                    delay,
+                )
+                time.sleep(delay)
+                self.rate_limits.pop(resource, None)
+
+        status, response_headers, output = self._request_json(*args, **kwargs)
+
+        # PyGithub lower-cases response header names
+        remaining = response_headers.get("x-ratelimit-remaining")
+        reset = response_headers.get("x-ratelimit-reset")
+        if remaining is not None and reset is not None:
+            resource = response_headers.get("x-ratelimit-resource", "core")
+            self.rate_limits[resource] = (int(remaining), int(reset))
+
+        return status, response_headers, output
+
+    def __call__(
+        self,
+        verb: str,
+        url: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        input: Any = None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Tuple[int, Dict[str, Any], str]:
+        # Leave non-GETs and caller-managed conditional requests untouched
+        if verb != "GET" or (
+            headers
+            and ("If-None-Match" in headers or "If-Modified-Since" in headers)
+        ):
+            return self._send(verb, url, parameters, headers, input, *args, **kwargs)
+
+        key = (url, json.dumps(parameters or {}, sort_keys=True, default=str))
+        with self._lock:
+            cached = self.cache.get(key)
+        if cached is not None:
+            etag, last_modified = cached[0], cached[1]
+            headers = dict(headers or {})
+            if etag:
+                headers["If-None-Match"] = etag
+            if last_modified:
+                headers["If-Modified-Since"] = last_modified
+
+        status, response_headers, output = self._send(
+            verb, url, parameters, headers, input, *args, **kwargs
+        )
+
+        if status == 304 and cached is not None:
+            return 200, cached[2], cached[3]
+
+        etag = response_headers.get("etag")
+        last_modified = response_headers.get("last-modified")
+        if status == 200 and (etag or last_modified):
+            with self._lock:
+                if key not in self.cache and len(self.cache) >= self.max_entries:
+                    # Evict the oldest entry
+                    self.cache.pop(next(iter(self.cache)))
+                self.cache[key] = (etag, last_modified, response_headers, output)
+
+        return status, response_headers, output
 
 
 class GitHubService:
     """
     Service class for interacting with the GitHub API using PyGithub.
 
+    Listing methods return PyGithub PaginatedList objects, which fetch pages on
+    demand as they are iterated. Wrap them in list() to materialize every item,
+    or use prefetch_pages() to fetch several pages concurrently.
+
     PyGithub documentation: https://pygithub.readthedocs.io/
     """
 
+    __slots__ = (
+        "token",
+        "timeout",
+        "verify",
+        "pool_size",
+        "github",
+        "cache_ttl",
+        "_etag_cache",
+        "_request_hook",
+        "_repo_cache",
+        "_read_cache",
+    )
+
     def __init__(
         self,
         token: str,
         base_url: Optional[str] = None,
         verify: bool = True,
         timeout: int = 30,
+        pool_size: int = 50,
+        cache_ttl: float = _DEFAULT_CACHE_TTL,
     ):
         """
         Initialize the GitHub Service.
@@ -38,6 +259,9 @@ class GitHubService:
             base_url: Base URL for GitHub Enterprise (optional, defaults to github.com)
             verify: Whether to verify SSL certificates (default: True)
             timeout: Request timeout in seconds (default: 30)
+            pool_size: Size of the keep-alive HTTP connection pool (default: 50)
+            cache_ttl: Seconds to memoize branch protection and label reads;
+                       0 disables it (default: 30)
 
         Raises:
             ValueError: If token is not provided
@@ -48,26 +272,85 @@ class GitHubService:
         self.token = token
         self.timeout = timeout
         self.verify = verify
-
-        # Initialize PyGithub client
+        self.pool_size = pool_size
+        self.cache_ttl = cache_ttl
+
+        # Initialize PyGithub client. PyGithub keeps one requests.Session per
+        # host; the pool is sized so concurrent calls reuse open connections,
+        # and GithubRetry backs off on transient errors and rate limits.
+        auth = Auth.Token(token)
+        retry = GithubRetry(total=3, backoff_factor=0.3)
         if base_url:
             self.github = Github(
                 base_url=base_url,
-                login_or_token=token,
+                auth=auth,
                 verify=verify,
                 timeout=timeout,
+                retry=retry,
+                pool_size=pool_size,
             )
         else:
             self.github = Github(
-                login_or_token=token,
+                auth=auth,
                 verify=verify,
                 timeout=timeout,
+                retry=retry,
+                pool_size=pool_size,
             )
 
+        # Revalidate every GET with conditional requests and track rate limits
+        self._etag_cache: Dict[
+            Tuple[str, str], Tuple[Optional[str], Optional[str], Dict[str, Any], str]
+        ] = {}
+        requester = self.github.requester
+        self._request_hook = _ConditionalRequestHook(
+            requester.requestJson, self._etag_cache
+        )
+        requester.requestJson = self._request_hook
+
+        # Hydrated Repository objects, most recently used last
+        self._repo_cache: OrderedDict[Tuple[str, str], Repository] = OrderedDict()
+
+        # Rarely changing reads, keyed by (method, owner, repo[, branch])
+        self._read_cache: Dict[Hashable, Tuple[float, Any]] = {}
+
+    @property
+    def rate_limit(self) -> Optional[Dict[str, int]]:
+        """
+        Core REST rate limit state reported by the most recent response.
+
+        Search and GraphQL requests have budgets of their own and do not
+        affect this value.
+
+        Returns:
+            Dictionary with "remaining" requests and the "reset" epoch time,
+            or None before any REST response carried rate limit headers
+        """
+        rate_limit = self._request_hook.rate_limits.get("core")
+        if rate_limit is None:
+            return None
+
+        remaining, reset = rate_limit
+        return {"remaining": remaining, "reset": reset}
+
+    def _cached(self, key: Hashable, fetch: Callable[[], _T]) -> _T:
+        """Return the memoized value for key, calling fetch() if absent or expired."""
+        entry = self._read_cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+
+        value = fetch()
+        if self.cache_ttl > 0:
+            self._read_cache[key] = (time.monotonic() + self.cache_ttl, value)
+        return value
+
     def get_repository(self, owner: str, repo: str) -> Repository:
         """
         Get a repository object.
 
+        Repository objects are memoized per (owner, repo), so repeated calls
+        don't re-fetch the repository. Use invalidate_repo() to drop one.
+
         Args:
             owner: Repository owner (username or organization)
             repo: Repository name
@@ -79,7 +362,96 @@ class GitHubService:
             >>> service = GitHubService(token="ghp_xxx")
             >>> repo = service.get_repository(owner="octocat", repo="Hello-World")
         """
-        return self.github.get_repo(f"{owner}/{repo}")
+        key = (owner, repo)
+        repository = self._repo_cache.get(key)
+
+        if repository is None:
+            repository = self.github.get_repo(f"{owner}/{repo}")
+            self._repo_cache[key] = repository
+            if len(self._repo_cache) > _REPO_CACHE_SIZE:
+                self._repo_cache.popitem(last=False)
+        else:
+            self._repo_cache.move_to_end(key)
+
+        return repository
+
+    def invalidate_repo(self, owner: str, repo: str) -> None:
+        """
+        Drop a memoized repository object so the next call re-fetches it.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+
+        Example:
+            >>> service = GitHubService(token="ghp_xxx")
+            >>> service.invalidate_repo(owner="octocat", repo="Hello-World")
+        """
+        self._repo_cache.pop((owner, repo), None)
+
+    def bind(self, owner: str, repo: str) -> "BoundRepoService":
+        """
+        Get a view of this service with the owner and repository fixed.
+
+        The repository is hydrated up front, and every method taking
+        (owner, repo) as its leading arguments is available on the returned
+        object without them.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+
+        Returns:
+            BoundRepoService for the repository
+
+        Example:
+            >>> service = GitHubService(token="ghp_xxx")
+            >>> hello = service.bind(owner="octocat", repo="Hello-World")
+            >>> pr = hello.get_pull_request(pr_number=1)
+            >>> hello.add_label_to_pull_request(pr_number=1, label_name="bug")
+        """
+        return BoundRepoService(self, owner, repo)
+
+    def prefetch_pages(self, items: PaginatedList[_T], pages: int) -> List[_T]:
+        """
+        Fetch the first pages of a paginated listing concurrently.
+
+        Args:
+            items: Paginated list returned by one of the listing methods
+            pages: Number of pages to fetch
+
+        Returns:
+            Items from the first ``pages`` pages, in order
+
+        Example:
+            >>> service = GitHubService(token="ghp_xxx")
+            >>> prs = service.prefetch_pages(
+            ...     service.get_pull_requests(owner="octocat", repo="Hello-World"),
+            ...     pages=5,
+            ... )
+        """
+        if pages <= 0:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, pages)) as executor:
+            results = list(executor.map(items.get_page, range(pages)))
+        return [item for page in results for item in page]
+
+    def _stream(self, items: PaginatedList[_T]) -> Iterator[_T]:
+        """
+        Yield the items of a paginated listing one page at a time.
+
+        Unlike iterating the PaginatedList itself, which keeps every element
+        it has fetched, only the current page is held in memory.
+        """
+        per_page = self.github.per_page
+        page = 0
+        while True:
+            batch = items.get_page(page)
+            yield from batch
+            if len(batch) < per_page:
+                return
+            page += 1
 
     def create_webhook(
         self,
@@ -136,7 +508,7 @@ class GitHubService:
             active=active,
         )
 
-    def get_webhooks(self, owner: str, repo: str) -> List[Hook]:
+    def get_webhooks(self, owner: str, repo: str) -> PaginatedList[Hook]:
         """
         Get all webhooks for a repository.
 
@@ -145,14 +517,14 @@ class GitHubService:
             repo: Repository name
 
         Returns:
-            List of Hook objects
+            Lazily paginated list of Hook objects
 
         Example:
             >>> service = GitHubService(token="ghp_xxx")
             >>> webhooks = service.get_webhooks(owner="octocat", repo="Hello-World")
         """
         repository = self.get_repository(owner, repo)
-        return list(repository.get_hooks())
+        return repository.get_hooks()
 
     def delete_webhook(self, owner: str, repo: str, hook_id: int) -> bool:
         """
@@ -170,9 +542,9 @@ class GitHubService:
             >>> service = GitHubService(token="ghp_xxx")
             >>> service.delete_webhook(owner="octocat", repo="Hello-World", hook_id=123456)
         """
-        repository = self.get_repository(owner, repo)
-        hook = repository.get_hook(hook_id)
-        hook.delete()
+        self.github.requester.requestJsonAndCheck(
+            "DELETE", f"/repos/{owner}/{repo}/hooks/{hook_id}"
+        )
         return True
 
     def create_pull_request(
@@ -239,6 +611,64 @@ class GitHubService:
         repository = self.get_repository(owner, repo)
         return repository.get_pull(pr_number)
 
+    def get_pull_request_bundle(
+        self, owner: str, repo: str, pr_number: int
+    ) -> PullRequestBundle:
+        """
+        Get a pull request with its labels and comments in one request.
+
+        Uses the GraphQL API, replacing the three REST round-trips of
+        get_pull_request, get_pull_request_labels and get_pull_request_comments.
+        At most the first 100 labels and comments are returned.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            pr_number: Pull request number
+
+        Returns:
+            PullRequestBundle with the pull request's title, body, state,
+            labels ({"name", "color"}) and comments ({"id", "body", "author"}).
+            state is "open" or "closed" as in the REST API; merged pull
+            requests are "closed" with merged set
+
+        Raises:
+            GithubException: If the query fails or the pull request is not found
+
+        Example:
+            >>> service = GitHubService(token="ghp_xxx")
+            >>> bundle = service.get_pull_request_bundle(
+            ...     owner="octocat",
+            ...     repo="Hello-World",
+            ...     pr_number=1
+            ... )
+            >>> [label["name"] for label in bundle.labels]
+        """
+        _, data = self.github.requester.graphql_query(
+            _PULL_REQUEST_BUNDLE_QUERY,
+            {"owner": owner, "repo": repo, "number": pr_number},
+        )
+        pr = data["data"]["repository"]["pullRequest"]
+
+        return PullRequestBundle(
+            number=pr["number"],
+            title=pr["title"],
+            body=pr["body"],
+            # GraphQL reports OPEN/CLOSED/MERGED; REST uses open/closed
+            state="closed" if pr["state"] == "MERGED" else pr["state"].lower(),
+            labels=pr["labels"]["nodes"],
+            comments=[
+                {
+                    "id": comment["databaseId"],
+                    "body": comment["body"],
+                    # Deleted accounts have no author
+                    "author": (comment["author"] or {}).get("login"),
+                }
+                for comment in pr["comments"]["nodes"]
+            ],
+            merged=pr["state"] == "MERGED",
+        )
+
     def get_pull_requests(
         self,
         owner: str,
@@ -246,7 +676,7 @@ class GitHubService:
         state: str = "open",
         base: Optional[str] = None,
         head: Optional[str] = None,
-    ) -> List[PullRequest]:
+    ) -> PaginatedList[PullRequest]:
         """
         Get pull requests for a repository.
 
@@ -258,14 +688,48 @@ class GitHubService:
             head: Filter by head branch (optional)
 
         Returns:
-            List of PullRequest objects
+            Lazily paginated list of PullRequest objects
 
         Example:
             >>> service = GitHubService(token="ghp_xxx")
             >>> prs = service.get_pull_requests(owner="octocat", repo="Hello-World", state="open")
         """
         repository = self.get_repository(owner, repo)
-        return list(repository.get_pulls(state=state, base=base, head=head))
+        # PyGithub rejects None for unset filters
+        return repository.get_pulls(
+            state=state,
+            base=NotSet if base is None else base,
+            head=NotSet if head is None else head,
+        )
+
+    def iter_pull_requests(
+        self,
+        owner: str,
+        repo: str,
+        state: str = "open",
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+    ) -> Iterator[PullRequest]:
+        """
+        Stream pull requests for a repository, holding one page at a time.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            state: PR state - "open", "closed", or "all" (default: "open")
+            base: Filter by base branch (optional)
+            head: Filter by head branch (optional)
+
+        Yields:
+            PullRequest objects
+
+        Example:
+            >>> service = GitHubService(token="ghp_xxx")
+            >>> for pr in service.iter_pull_requests(owner="octocat", repo="Hello-World"):
+            ...     if pr.draft:
+            ...         break
+        """
+        yield from self._stream(self.get_pull_requests(owner, repo, state, base, head))
 
     def push_to_pull_request(
         self,
@@ -314,28 +778,16 @@ class GitHubService:
         # Get the current commit
         commit = repository.get_git_commit(ref.object.sha)
 
-        # Get the tree
-        tree = repository.get_git_tree(commit.tree.sha, recursive=True)
-
         # Create blob for the new file
         blob = repository.create_git_blob(content, "utf-8")
 
-        # Create new tree entry
-        from github import InputGitTreeElement
-
-        tree_elements = []
-        for element in tree.tree:
-            if element.path != file_path:
-                tree_elements.append(
-                    InputGitTreeElement(
-                        element.path, element.mode, element.type, element.sha
-                    )
-                )
-
-        tree_elements.append(InputGitTreeElement(file_path, "100644", "blob", blob.sha))
+        # Create new tree entry; GitHub layers it onto base_tree server-side
+        tree_elements = [
+            InputGitTreeElement(file_path, "100644", "blob", sha=blob.sha)
+        ]
 
         # Create new tree
-        new_tree = repository.create_git_tree(tree_elements, base_tree=tree)
+        new_tree = repository.create_git_tree(tree_elements, base_tree=commit.tree)
 
         # Create new commit
         new_commit = repository.create_git_commit(message, new_tree, [commit])
@@ -383,18 +835,6 @@ class GitHubService:
         """
         repository = self.get_repository(owner, repo)
 
-        # Check if branch already exists
-        try:
-            repository.get_git_ref(f"heads/{branch}")
-            raise ValueError(f"Branch '{branch}' already exists")
-        except GithubException as e:
-            # Branch doesn't exist (404 or similar), which is what we want
-            if e.status != 404:
-                raise
-        except ValueError:
-            # Re-raise ValueError if branch exists
-            raise
-
         # Get the base branch reference
         try:
             base_ref = repository.get_git_ref(f"heads/{base_branch}")
@@ -402,7 +842,14 @@ class GitHubService:
             raise ValueError(f"Base branch '{base_branch}' not found: {e}")
 
         # Create new branch from base branch
-        repository.create_git_ref(f"refs/heads/{branch}", base_ref.object.sha)
+        try:
+            repository.create_git_ref(f"refs/heads/{branch}", base_ref.object.sha)
+        except GithubException as e:
+            # 422 also covers invalid ref names; only translate the duplicate
+            message = e.data.get("message", "") if isinstance(e.data, dict) else ""
+            if e.status == 422 and "Reference already exists" in message:
+                raise ValueError(f"Branch '{branch}' already exists")
+            raise
 
         return {
             "branch": branch,
@@ -463,33 +910,15 @@ class GitHubService:
         # Get the current commit
         commit = repository.get_git_commit(branch_ref.object.sha)
 
-        # Get the current tree
-        tree = repository.get_git_tree(commit.tree.sha, recursive=True)
-
-        # Create blobs for all files
-        from github import InputGitTreeElement
-
-        file_paths = set(files.keys())
-        tree_elements = []
-
-        # Keep existing tree elements that are not being updated
-        for element in tree.tree:
-            if element.path not in file_paths:
-                tree_elements.append(
-                    InputGitTreeElement(
-                        element.path, element.mode, element.type, element.sha
-                    )
-                )
-
-        # Create blobs and add new/updated files to tree
-        for file_path, content in files.items():
-            blob = repository.create_git_blob(content, "utf-8")
-            tree_elements.append(
-                InputGitTreeElement(file_path, "100644", "blob", blob.sha)
-            )
+        # Create blobs concurrently. Only new/updated files go in the tree;
+        # GitHub layers them onto base_tree server-side.
+        tree_elements = [
+            InputGitTreeElement(file_path, "100644", "blob", sha=blob_sha)
+            for file_path, blob_sha in zip(files, self._create_blobs(repository, files))
+        ]
 
         # Create new tree
-        new_tree = repository.create_git_tree(tree_elements, base_tree=tree)
+        new_tree = repository.create_git_tree(tree_elements, base_tree=commit.tree)
 
         # Create new commit
         new_commit = repository.create_git_commit(message, new_tree, [commit])
@@ -504,6 +933,26 @@ class GitHubService:
             "message": message,
         }
 
+    def _create_blobs(self, repository: Repository, files: Dict[str, str]) -> List[str]:
+        """
+        Create a blob for each file's content, issuing the requests concurrently.
+
+        Args:
+            repository: Repository to create the blobs in
+            files: Dictionary mapping file paths to file contents
+
+        Returns:
+            List of blob SHAs, in the same order as files
+        """
+        max_workers = min(_MAX_BLOB_WORKERS, self.pool_size, len(files)) or 1
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda content: repository.create_git_blob(content, "utf-8").sha,
+                    files.values(),
+                )
+            )
+
     def update_branch_protection(
         self,
         owner: str,
@@ -569,6 +1018,7 @@ class GitHubService:
             allow_force_pushes=allow_force_pushes,
             allow_deletions=allow_deletions,
         )
+        self.invalidate_branch_protection(owner, repo, branch)
 
         return branch_obj
 
@@ -584,7 +1034,7 @@ class GitHubService:
             branch: Branch name
 
         Returns:
-            Dictionary with protection rules
+            Dictionary with protection rules, memoized for cache_ttl seconds
 
         Example:
             >>> service = GitHubService(token="ghp_xxx")
@@ -594,17 +1044,35 @@ class GitHubService:
             ...     branch="main"
             ... )
         """
-        repository = self.get_repository(owner, repo)
-        branch_obj = repository.get_branch(branch)
 
-        protection = branch_obj.get_protection()
+        def fetch() -> Dict[str, Any]:
+            repository = self.get_repository(owner, repo)
+            branch_obj = repository.get_branch(branch)
 
-        return {
-            "required_status_checks": protection.required_status_checks,
-            "enforce_admins": protection.enforce_admins,
-            "required_pull_request_reviews": protection.required_pull_request_reviews,
-            "restrictions": protection.restrictions,
-        }
+            protection = branch_obj.get_protection()
+
+            return {
+                "required_status_checks": protection.required_status_checks,
+                "enforce_admins": protection.enforce_admins,
+                "required_pull_request_reviews": protection.required_pull_request_reviews,
+                "restrictions": protection.restrictions,
+            }
+
+        # Copy so callers can't mutate the memoized dictionary
+        return dict(
+            self._cached(("branch_protection", owner, repo, branch), fetch)
+        )
+
+    def invalidate_branch_protection(self, owner: str, repo: str, branch: str) -> None:
+        """
+        Drop memoized branch protection rules so the next read re-fetches them.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            branch: Branch name
+        """
+        self._read_cache.pop(("branch_protection", owner, repo, branch), None)
 
     def create_label(
         self,
@@ -638,7 +1106,9 @@ class GitHubService:
             ... )
         """
         repository = self.get_repository(owner, repo)
-        return repository.create_label(name=name, color=color, description=description)
+        label = repository.create_label(name=name, color=color, description=description)
+        self.invalidate_labels(owner, repo)
+        return label
 
     def get_labels(self, owner: str, repo: str) -> List[Label]:
         """
@@ -649,14 +1119,34 @@ class GitHubService:
             repo: Repository name
 
         Returns:
-            List of Label objects
+            List of Label objects; every page is fetched up front and the
+            result memoized for cache_ttl seconds
 
         Example:
             >>> service = GitHubService(token="ghp_xxx")
             >>> labels = service.get_labels(owner="octocat", repo="Hello-World")
         """
-        repository = self.get_repository(owner, repo)
-        return list(repository.get_labels())
+        labels = self._cached(
+            ("labels", owner, repo),
+            lambda: list(self.get_repository(owner, repo).get_labels()),
+        )
+        # Copy so callers can't mutate the memoized list
+        return list(labels)
+
+    def invalidate_labels(self, owner: str, repo: str) -> None:
+        """
+        Drop memoized repository labels so the next read re-fetches them.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+        """
+        self._read_cache.pop(("labels", owner, repo), None)
+
+    def _issue_labels_url(self, owner: str, repo: str, pr_number: int) -> str:
+        # Pull request labels are issue labels; the Issues API avoids hydrating
+        # the pull request (and the repository) first
+        return f"/repos/{owner}/{repo}/issues/{pr_number}/labels"
 
     def add_label_to_pull_request(
         self, owner: str, repo: str, pr_number: int, label_name: str
@@ -682,9 +1172,13 @@ class GitHubService:
             ...     label_name="bug"
             ... )
         """
-        repository = self.get_repository(owner, repo)
-        pr = repository.get_pull(pr_number)
-        pr.add_to_labels(label_name)
+        self.github.requester.requestJsonAndCheck(
+            "POST",
+            self._issue_labels_url(owner, repo, pr_number),
+            input={"labels": [label_name]},
+        )
+        # Unknown label names are created on the repository
+        self.invalidate_labels(owner, repo)
         return True
 
     def remove_label_from_pull_request(
@@ -711,14 +1205,16 @@ class GitHubService:
             ...     label_name="bug"
             ... )
         """
-        repository = self.get_repository(owner, repo)
-        pr = repository.get_pull(pr_number)
-        pr.remove_from_labels(label_name)
+        self.github.requester.requestJsonAndCheck(
+            "DELETE",
+            f"{self._issue_labels_url(owner, repo, pr_number)}/"
+            f"{urllib.parse.quote(label_name, safe='')}",
+        )
         return True
 
     def get_pull_request_labels(
         self, owner: str, repo: str, pr_number: int
-    ) -> List[Label]:
+    ) -> PaginatedList[Label]:
         """
         Get all labels for a pull request.
 
@@ -728,7 +1224,7 @@ class GitHubService:
             pr_number: Pull request number
 
         Returns:
-            List of Label objects
+            Lazily paginated list of Label objects
 
         Example:
             >>> service = GitHubService(token="ghp_xxx")
@@ -738,9 +1234,12 @@ class GitHubService:
             ...     pr_number=1
             ... )
         """
-        repository = self.get_repository(owner, repo)
-        pr = repository.get_pull(pr_number)
-        return list(pr.get_labels())
+        return PaginatedList(
+            Label,
+            self.github.requester,
+            self._issue_labels_url(owner, repo, pr_number),
+            None,
+        )
 
     def create_pull_request_comment(
         self,
@@ -792,7 +1291,7 @@ class GitHubService:
 
     def get_pull_request_comments(
         self, owner: str, repo: str, pr_number: int
-    ) -> List[IssueComment]:
+    ) -> PaginatedList[IssueComment]:
         """
         Get all comments for a pull request.
 
@@ -802,7 +1301,7 @@ class GitHubService:
             pr_number: Pull request number
 
         Returns:
-            List of IssueComment objects
+            Lazily paginated list of IssueComment objects
 
         Example:
             >>> service = GitHubService(token="ghp_xxx")
@@ -814,7 +1313,30 @@ class GitHubService:
         """
         repository = self.get_repository(owner, repo)
         pr = repository.get_pull(pr_number)
-        return list(pr.get_issue_comments())
+        return pr.get_issue_comments()
+
+    def iter_pull_request_comments(
+        self, owner: str, repo: str, pr_number: int
+    ) -> Iterator[IssueComment]:
+        """
+        Stream comments for a pull request, holding one page at a time.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            pr_number: Pull request number
+
+        Yields:
+            IssueComment objects
+
+        Example:
+            >>> service = GitHubService(token="ghp_xxx")
+            >>> for comment in service.iter_pull_request_comments(
+            ...     owner="octocat", repo="Hello-World", pr_number=1
+            ... ):
+            ...     print(comment.body)
+        """
+        yield from self._stream(self.get_pull_request_comments(owner, repo, pr_number))
 
     def update_pull_request_comment(
         self,
@@ -844,9 +1366,13 @@ class GitHubService:
             ...     body="Updated comment"
             ... )
         """
-        repository = self.get_repository(owner, repo)
-        comment = repository.get_issue_comment(comment_id)
-        return comment.edit(body)
+        requester = self.github.requester
+        headers, data = requester.requestJsonAndCheck(
+            "PATCH",
+            f"/repos/{owner}/{repo}/issues/comments/{comment_id}",
+            input={"body": body},
+        )
+        return IssueComment(requester, headers, data, completed=True)
 
     def delete_pull_request_comment(
         self, owner: str, repo: str, comment_id: int
@@ -870,7 +1396,44 @@ class GitHubService:
             ...     comment_id=123456
             ... )
         """
-        repository = self.get_repository(owner, repo)
-        comment = repository.get_issue_comment(comment_id)
-        comment.delete()
+        self.github.requester.requestJsonAndCheck(
+            "DELETE", f"/repos/{owner}/{repo}/issues/comments/{comment_id}"
+        )
         return True
+
+
+# Public GitHubService methods whose leading arguments are (owner, repo)
+_REPO_SCOPED_METHODS = frozenset(
+    name
+    for name, member in vars(GitHubService).items()
+    if not name.startswith("_")
+    and name != "bind"
+    and inspect.isfunction(member)
+    and list(inspect.signature(member).parameters)[1:3] == ["owner", "repo"]
+)
+
+
+class BoundRepoService:
+    """
+    GitHubService methods bound to a single repository.
+
+    Returned by GitHubService.bind(); each repository-scoped method is exposed
+    with owner and repo already applied, e.g. ``bound.get_labels()``.
+    """
+
+    def __init__(self, service: GitHubService, owner: str, repo: str):
+        self.service = service
+        self.owner = owner
+        self.repo = repo
+        self.repository = service.get_repository(owner, repo)
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        if name not in _REPO_SCOPED_METHODS:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+
+        method = partial(getattr(self.service, name), self.owner, self.repo)
+        # Cache on the instance so later lookups skip __getattr__
+        setattr(self, name, method)
+        return method
@@ -0,0 +1,780 @@
+"""
+Async GitHub Service - asyncio client for interacting with GitHub REST API.
+
+This service mirrors the core of GitHubService on top of aiohttp so that
+independent requests (blob uploads, paginated listings, bulk mutations) can be
+issued concurrently with asyncio.gather instead of one round-trip at a time.
+Responses are returned as plain dictionaries parsed from the REST API.
+
+With transport="httpx" requests go through an HTTP/2 httpx client instead, so
+concurrent requests are multiplexed over a single connection.
+"""
+
+import asyncio
+import re
+import urllib.parse
+from typing import Optional, List, Dict, Any, Literal, Mapping, Tuple, TYPE_CHECKING
+
+import aiohttp
+
+if TYPE_CHECKING:
+    import httpx
+
+DEFAULT_BASE_URL = "https://api.github.com"
+
+# Matches the page number of the rel="last" entry in a Link header
+_LAST_PAGE_RE = re.compile(r'<[^>]*[?&]page=(\d+)[^>]*>;\s*rel="last"')
+
+
+def _error_status(error: Exception) -> Optional[int]:
+    """Return the HTTP status of an aiohttp or httpx response error, if any."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None)
+
+
+def _error_message(error: Exception) -> str:
+    """Return the response body of an aiohttp or httpx response error."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.message
+    response = getattr(error, "response", None)
+    return getattr(response, "text", "")
+
+
+class AsyncGitHubService:
+    """
+    Async service class for interacting with the GitHub REST API.
+
+    Must be used as an async context manager so the underlying HTTP session
+    is opened and closed properly.
+
+    GitHub REST API documentation: https://docs.github.com/en/rest
+    """
+
+    def __init__(
+        self,
+        token: str,
+        base_url: Optional[str] = None,
+        verify: bool = True,
+        timeout: int = 30,
+        max_connections: int = 32,
+        per_page: int = 100,
+        transport: Literal["aiohttp", "httpx"] = "aiohttp",
+    ):
+        """
+        Initialize the Async GitHub Service.
+
+        Args:
+            token: GitHub personal access token or OAuth token
+            base_url: Base URL for GitHub Enterprise (optional, defaults to github.com)
+            verify: Whether to verify SSL certificates (default: True)
+            timeout: Request timeout in seconds (default: 30)
+            max_connections: Maximum number of concurrent connections (default: 32)
+            per_page: Page size used for listings (default: 100, GitHub's maximum)
+            transport: HTTP client backing the service - "aiohttp" (default) or
+                       "httpx", which multiplexes requests over HTTP/2.
+                       The "httpx" transport requires the 'http2' extra.
+
+        Raises:
+            ValueError: If token is not provided or the transport is not supported
+        """
+        if not token:
+            raise ValueError("token is required")
+
+        if transport not in ("aiohttp", "httpx"):
+            raise ValueError(f"Unsupported transport: {transport}")
+
+        self.token = token
+        self.base_url = (base_url or DEFAULT_BASE_URL).rstrip("/")
+        self.verify = verify
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.per_page = per_page
+        self.transport = transport
+
+        self.headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.github+json",
+        }
+
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._client: Optional["httpx.AsyncClient"] = None
+
+    async def __aenter__(self) -> "AsyncGitHubService":
+        if self.transport == "httpx":
+            self._client = self._build_httpx_client()
+        else:
+            self._session = aiohttp.ClientSession(
+                headers=self.headers,
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_connections, ssl=self.verify
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self
+
+    def _build_httpx_client(self) -> "httpx.AsyncClient":
+        """
+        Build an HTTP/2 httpx client sharing this service's configuration.
+
+        Raises:
+            ImportError: If httpx (with HTTP/2 support) is not installed
+        """
+        try:
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "httpx is required for transport='httpx' "
+                "(install with the 'http2' extra)"
+            ) from e
+
+        return httpx.AsyncClient(
+            headers=self.headers,
+            verify=self.verify,
+            timeout=self.timeout,
+            http2=True,
+            limits=httpx.Limits(max_connections=self.max_connections),
+        )
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying HTTP session."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        """
+        Make an HTTP request to the GitHub API.
+
+        Args:
+            method: HTTP method (GET, POST, PATCH, DELETE, etc.)
+            path: API path (e.g., '/repos/octocat/Hello-World')
+            params: Query parameters
+            json_data: JSON body data
+
+        Returns:
+            Parsed JSON response (None for empty responses)
+
+        Raises:
+            RuntimeError: If the service is used outside of ``async with``
+            aiohttp.ClientResponseError: If the request fails
+            httpx.HTTPError: If the request fails using the httpx transport
+        """
+        data, _ = await self._request_with_headers(method, path, params, json_data)
+        return data
+
+    async def _request_with_headers(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Any, Mapping[str, str]]:
+        """Like _request, but also return the response headers."""
+        if self._client is not None:
+            response = await self._client.request(
+                method, f"{self.base_url}{path}", params=params, json=json_data
+            )
+            response.raise_for_status()
+
+            # Handle empty responses
+            if response.status_code == 204 or not response.content:
+                return None, response.headers
+
+            return response.json(), response.headers
+
+        if self._session is None:
+            raise RuntimeError(
+                "AsyncGitHubService must be used as an async context manager"
+            )
+
+        async with self._session.request(
+            method, f"{self.base_url}{path}", params=params, json=json_data
+        ) as response:
+            if not response.ok:
+                # Keep GitHub's error body; raise_for_status drops it
+                raise aiohttp.ClientResponseError(
+                    response.request_info,
+                    response.history,
+                    status=response.status,
+                    message=await response.text() or response.reason or "",
+                    headers=response.headers,
+                )
+
+            # Handle empty responses
+            if response.status == 204:
+                return None, response.headers
+
+            body = await response.read()
+            if not body:
+                return None, response.headers
+
+            return await response.json(content_type=None), response.headers
+
+    async def _get_paginated(
+        self, path: str, params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch every page of a listing endpoint.
+
+        The first page is fetched to discover the page count from the Link
+        header; the remaining pages are then fetched concurrently.
+
+        Args:
+            path: API path of the listing endpoint
+            params: Query parameters (None values are dropped)
+
+        Returns:
+            Concatenated list of items from all pages
+        """
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        params["per_page"] = self.per_page
+
+        first_page, headers = await self._request_with_headers(
+            "GET", path, params={**params, "page": 1}
+        )
+        items = list(first_page or [])
+
+        match = _LAST_PAGE_RE.search(headers.get("Link", ""))
+        if match:
+            last_page = int(match.group(1))
+            pages = await asyncio.gather(
+                *(
+                    self._request("GET", path, params={**params, "page": page})
+                    for page in range(2, last_page + 1)
+                )
+            )
+            for page in pages:
+                items.extend(page or [])
+
+        return items
+
+    async def get_repository(self, owner: str, repo: str) -> Dict[str, Any]:
+        """
+        Get a repository.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+
+        Returns:
+            Repository dictionary
+        """
+        return await self._request("GET", f"/repos/{owner}/{repo}")
+
+    async def create_webhook(
+        self,
+        owner: str,
+        repo: str,
+        url: str,
+        content_type: str = "json",
+        secret: Optional[str] = None,
+        events: Optional[List[str]] = None,
+        active: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Create a webhook for a repository.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            url: Webhook URL to receive events
+            content_type: Content type for webhook payloads (default: "json")
+            secret: Secret token for webhook (optional)
+            events: List of events to subscribe to (optional, defaults to all events)
+            active: Whether the webhook is active (default: True)
+
+        Returns:
+            Hook dictionary
+        """
+        config = {
+            "url": url,
+            "content_type": content_type,
+        }
+
+        if secret:
+            config["secret"] = secret
+
+        if events is None:
+            events = ["*"]
+
+        return await self._request(
+            "POST",
+            f"/repos/{owner}/{repo}/hooks",
+            json_data={
+                "name": "web",
+                "config": config,
+                "events": events,
+                "active": active,
+            },
+        )
+
+    async def get_webhooks(self, owner: str, repo: str) -> List[Dict[str, Any]]:
+        """
+        Get all webhooks for a repository.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+
+        Returns:
+            List of hook dictionaries
+        """
+        return await self._get_paginated(f"/repos/{owner}/{repo}/hooks")
+
+    async def delete_webhook(self, owner: str, repo: str, hook_id: int) -> bool:
+        """
+        Delete a webhook by ID.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            hook_id: Webhook ID to delete
+
+        Returns:
+            True if successful
+        """
+        await self._request("DELETE", f"/repos/{owner}/{repo}/hooks/{hook_id}")
+        return True
+
+    async def create_pull_request(
+        self,
+        owner: str,
+        repo: str,
+        title: str,
+        head: str,
+        base: str,
+        body: Optional[str] = None,
+        draft: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Create a pull request.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            title: Pull request title
+            head: Branch name containing the changes (source branch)
+            base: Branch name to merge into (target branch)
+            body: Pull request description (optional)
+            draft: Whether to create as a draft PR (default: False)
+
+        Returns:
+            Pull request dictionary
+        """
+        return await self._request(
+            "POST",
+            f"/repos/{owner}/{repo}/pulls",
+            json_data={
+                "title": title,
+                "body": body or "",
+                "head": head,
+                "base": base,
+                "draft": draft,
+            },
+        )
+
+    async def get_pull_request(
+        self, owner: str, repo: str, pr_number: int
+    ) -> Dict[str, Any]:
+        """
+        Get a pull request by number.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            pr_number: Pull request number
+
+        Returns:
+            Pull request dictionary
+        """
+        return await self._request("GET", f"/repos/{owner}/{repo}/pulls/{pr_number}")
+
+    async def get_pull_requests(
+        self,
+        owner: str,
+        repo: str,
+        state: str = "open",
+        base: Optional[str] = None,
+        head: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Get pull requests for a repository.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            state: PR state - "open", "closed", or "all" (default: "open")
+            base: Filter by base branch (optional)
+            head: Filter by head branch (optional)
+
+        Returns:
+            List of pull request dictionaries
+        """
+        return await self._get_paginated(
+            f"/repos/{owner}/{repo}/pulls",
+            params={"state": state, "base": base, "head": head},
+        )
+
+    async def create_branch(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        base_branch: str,
+    ) -> Dict[str, Any]:
+        """
+        Create a new branch from a base branch.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            branch: Name of the new branch to create
+            base_branch: Name of the base branch to create from
+
+        Returns:
+            Dictionary with branch information
+
+        Raises:
+            ValueError: If base branch is not found or branch already exists
+        """
+        try:
+            base_ref = await self._request(
+                "GET", f"/repos/{owner}/{repo}/git/ref/heads/{base_branch}"
+            )
+        except Exception as e:
+            raise ValueError(f"Base branch '{base_branch}' not found: {e}")
+
+        sha = base_ref["object"]["sha"]
+
+        try:
+            await self._request(
+                "POST",
+                f"/repos/{owner}/{repo}/git/refs",
+                json_data={"ref": f"refs/heads/{branch}", "sha": sha},
+            )
+        except Exception as e:
+            # 422 also covers invalid ref names; only translate the duplicate
+            if _error_status(e) == 422 and "Reference already exists" in (
+                _error_message(e)
+            ):
+                raise ValueError(f"Branch '{branch}' already exists")
+            raise
+
+        return {
+            "branch": branch,
+            "base_branch": base_branch,
+            "commit_sha": sha,
+        }
+
+    async def push_files_to_branch(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        files: Dict[str, str],
+        message: str,
+    ) -> Dict[str, Any]:
+        """
+        Push multiple files to a branch in a single commit.
+
+        Blobs for all files are created concurrently, and the new tree is
+        layered onto the current one server-side via base_tree.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            branch: Name of the branch to push files to
+            files: Dictionary mapping file paths to file contents
+            message: Commit message
+
+        Returns:
+            Dictionary with commit information
+
+        Raises:
+            ValueError: If branch is not found
+        """
+        repo_path = f"/repos/{owner}/{repo}"
+
+        try:
+            branch_ref = await self._request(
+                "GET", f"{repo_path}/git/ref/heads/{branch}"
+            )
+        except Exception as e:
+            raise ValueError(f"Branch '{branch}' not found: {e}")
+
+        commit_sha = branch_ref["object"]["sha"]
+
+        commit, *blobs = await asyncio.gather(
+            self._request("GET", f"{repo_path}/git/commits/{commit_sha}"),
+            *(
+                self._request(
+                    "POST",
+                    f"{repo_path}/git/blobs",
+                    json_data={"content": content, "encoding": "utf-8"},
+                )
+                for content in files.values()
+            ),
+        )
+
+        tree = await self._request(
+            "POST",
+            f"{repo_path}/git/trees",
+            json_data={
+                "base_tree": commit["tree"]["sha"],
+                "tree": [
+                    {"path": path, "mode": "100644", "type": "blob", "sha": blob["sha"]}
+                    for path, blob in zip(files, blobs)
+                ],
+            },
+        )
+
+        new_commit = await self._request(
+            "POST",
+            f"{repo_path}/git/commits",
+            json_data={"message": message, "tree": tree["sha"], "parents": [commit_sha]},
+        )
+
+        await self._request(
+            "PATCH",
+            f"{repo_path}/git/refs/heads/{branch}",
+            json_data={"sha": new_commit["sha"]},
+        )
+
+        return {
+            "commit_sha": new_commit["sha"],
+            "branch": branch,
+            "files": list(files.keys()),
+            "message": message,
+        }
+
+    async def push_to_pull_request(
+        self,
+        owner: str,
+        repo: str,
+        branch: str,
+        file_path: str,
+        content: str,
+        message: str,
+        pr_number: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Push a file to a branch (which may be associated with a pull request).
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            branch: Branch name to push to (should be the PR's head branch)
+            file_path: Path to the file in the repository
+            content: File content
+            message: Commit message
+            pr_number: Optional PR number for reference
+
+        Returns:
+            Dictionary with commit information
+        """
+        result = await self.push_files_to_branch(
+            owner, repo, branch, {file_path: content}, message
+        )
+
+        return {
+            "commit_sha": result["commit_sha"],
+            "branch": branch,
+            "file_path": file_path,
+            "message": message,
+        }
+
+    async def create_label(
+        self,
+        owner: str,
+        repo: str,
+        name: str,
+        color: str,
+        description: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Create a label in the repository.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            name: Label name
+            color: Label color in hex format (e.g., "FF0000" for red)
+            description: Label description (optional)
+
+        Returns:
+            Label dictionary
+        """
+        payload = {"name": name, "color": color}
+        if description is not None:
+            payload["description"] = description
+
+        return await self._request(
+            "POST", f"/repos/{owner}/{repo}/labels", json_data=payload
+        )
+
+    async def get_labels(self, owner: str, repo: str) -> List[Dict[str, Any]]:
+        """
+        Get all labels for a repository.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+
+        Returns:
+            List of label dictionaries
+        """
+        return await self._get_paginated(f"/repos/{owner}/{repo}/labels")
+
+    async def add_label_to_pull_request(
+        self, owner: str, repo: str, pr_number: int, label_name: str
+    ) -> bool:
+        """
+        Add a label to a pull request.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            pr_number: Pull request number
+            label_name: Label name to add
+
+        Returns:
+            True if successful
+        """
+        await self._request(
+            "POST",
+            f"/repos/{owner}/{repo}/issues/{pr_number}/labels",
+            json_data={"labels": [label_name]},
+        )
+        return True
+
+    async def remove_label_from_pull_request(
+        self, owner: str, repo: str, pr_number: int, label_name: str
+    ) -> bool:
+        """
+        Remove a label from a pull request.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            pr_number: Pull request number
+            label_name: Label name to remove
+
+        Returns:
+            True if successful
+        """
+        name = urllib.parse.quote(label_name, safe="")
+        await self._request(
+            "DELETE", f"/repos/{owner}/{repo}/issues/{pr_number}/labels/{name}"
+        )
+        return True
+
+    async def get_pull_request_labels(
+        self, owner: str, repo: str, pr_number: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all labels for a pull request.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            pr_number: Pull request number
+
+        Returns:
+            List of label dictionaries
+        """
+        return await self._get_paginated(
+            f"/repos/{owner}/{repo}/issues/{pr_number}/labels"
+        )
+
+    async def create_pull_request_comment(
+        self, owner: str, repo: str, pr_number: int, body: str
+    ) -> Dict[str, Any]:
+        """
+        Create a comment on a pull request.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            pr_number: Pull request number
+            body: Comment body text
+
+        Returns:
+            Comment dictionary
+        """
+        return await self._request(
+            "POST",
+            f"/repos/{owner}/{repo}/issues/{pr_number}/comments",
+            json_data={"body": body},
+        )
+
+    async def get_pull_request_comments(
+        self, owner: str, repo: str, pr_number: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Get all comments for a pull request.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            pr_number: Pull request number
+
+        Returns:
+            List of comment dictionaries
+        """
+        return await self._get_paginated(
+            f"/repos/{owner}/{repo}/issues/{pr_number}/comments"
+        )
+
+    async def update_pull_request_comment(
+        self, owner: str, repo: str, comment_id: int, body: str
+    ) -> Dict[str, Any]:
+        """
+        Update a pull request comment.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            comment_id: Comment ID to update
+            body: New comment body text
+
+        Returns:
+            Updated comment dictionary
+        """
+        return await self._request(
+            "PATCH",
+            f"/repos/{owner}/{repo}/issues/comments/{comment_id}",
+            json_data={"body": body},
+        )
+
+    async def delete_pull_request_comment(
+        self, owner: str, repo: str, comment_id: int
+    ) -> bool:
+        """
+        Delete a pull request comment.
+
+        Args:
+            owner: Repository owner (username or organization)
+            repo: Repository name
+            comment_id: Comment ID to delete
+
+        Returns:
+            True if successful
+        """
+        await self._request(
+            "DELETE", f"/repos/{owner}/{repo}/issues/comments/{comment_id}"
+        )
+        return True
@@ -1,18 +1,26 @@
 import json
 
-def handler(event, context):
-    response_body = {
-        "message": "Hello from Lambda!",
-        "input": event,
-    }
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    _dumps = json.dumps
 
-    response = {
-        "statusCode": 200,
-        "headers": {
-            "Content-Type": "application/json",
-        },
-        "body": json.dumps(response_body),
-    }
+MESSAGE = "Hello from Lambda!"
 
-    return response
+HEADERS = {
+    "Content-Type": "application/json",
+}
 
+# Built once per cold start; each invocation only adds the body
+_BASE = {
+    "statusCode": 200,
+    "headers": HEADERS,
+}
+
+
+def handler(event, context):
+    return {**_BASE, "body": _dumps({"message": MESSAGE, "input": event})}
@@ -0,0 +1,52 @@
+"""
+Fixtures for the benchmarks.
+
+Kept out of the top-level conftest so requests is only imported when the
+benchmarks are collected.
+"""
+
+import pytest
+from requests import Response
+from requests.adapters import HTTPAdapter
+
+from services.atlantis.atlantis import AtlantisService
+
+
+class FakeAdapter(HTTPAdapter):
+    """
+    Transport adapter that answers requests from an in-memory route table.
+
+    Routes map ``(method, url without query string)`` to ``(status, body)``.
+    Much cheaper per call than ``responses``, so it suits benchmarks that
+    should measure the service rather than the HTTP mock.
+    """
+
+    def __init__(self, routes):
+        super().__init__()
+        self.routes = routes
+
+    def send(self, request, **kwargs):
+        status, body = self.routes[(request.method, request.url.split("?")[0])]
+        response = Response()
+        response.status_code = status
+        response._content = body
+        response.url = request.url
+        response.request = request
+        return response
+
+
+@pytest.fixture
+def fake_routes():
+    """Route table served by ``fake_atlantis_service``; tests add their routes."""
+    return {}
+
+
+@pytest.fixture
+def fake_atlantis_service(fake_routes):
+    """AtlantisService whose session is served by a FakeAdapter over fake_routes."""
+    service = AtlantisService(
+        base_url="https://atlantis.example.com", token="test-token", cache_ttl={}
+    )
+    service._session.mount("https://", FakeAdapter(fake_routes))
+    yield service
+    service.close()
@@ -0,0 +1,64 @@
+"""
+Benchmarks for Atlantis Service.
+
+Skipped by default; run with ``pytest --benchmark-enable --benchmark-only -n 0``,
+or under CodSpeed with ``pytest src/tests/benchmarks --codspeed -o addopts=""``.
+Requests are answered by FakeAdapter so timings reflect the service, not the
+HTTP mock.
+"""
+
+import json
+
+import pytest
+
+from services.atlantis.atlantis import AtlantisService
+
+BASE_URL = "https://atlantis.example.com"
+PATHS = [{"Directory": ".", "Workspace": "default"}]
+
+# Benchmarks run for as long as they need to; the suite-wide limit is for tests
+pytestmark = pytest.mark.fail_slow("0s", enabled=False)
+
+
+@pytest.mark.benchmark
+def test_init_with_token():
+    """Benchmark constructing a service (validation and header setup)."""
+    service = AtlantisService(base_url=BASE_URL, token="test-token")
+    assert service.headers["X-Atlantis-Token"] == "test-token"
+
+
+def test_plan_throughput(benchmark, fake_routes, fake_atlantis_service):
+    """Benchmark submitting a plan."""
+    fake_routes[("POST", f"{BASE_URL}/api/plan")] = (200, b'{"status": "planned"}')
+
+    result = benchmark(
+        fake_atlantis_service.plan,
+        repository="owner/repo",
+        ref="main",
+        vcs_type="Github",
+        paths=PATHS,
+    )
+    assert result == {"status": "planned"}
+
+
+def test_apply_throughput(benchmark, fake_routes, fake_atlantis_service):
+    """Benchmark submitting an apply."""
+    fake_routes[("POST", f"{BASE_URL}/api/apply")] = (200, b'{"status": "applied"}')
+
+    result = benchmark(
+        fake_atlantis_service.apply,
+        repository="owner/repo",
+        ref="main",
+        vcs_type="Github",
+        paths=PATHS,
+    )
+    assert result == {"status": "applied"}
+
+
+def test_get_projects_throughput(benchmark, fake_routes, fake_atlantis_service):
+    """Benchmark listing projects."""
+    body = {"projects": [{"name": "project1"}, {"name": "project2"}]}
+    fake_routes[("GET", f"{BASE_URL}/api/projects")] = (200, json.dumps(body).encode())
+
+    projects = benchmark(fake_atlantis_service.get_projects)
+    assert len(projects) == 2
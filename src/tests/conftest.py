@@ -2,4 +2,75 @@
 Pytest configuration and fixtures.
 
 Shared fixtures and configuration for all tests.
+
+Imports of the services and HTTP mocking libraries happen inside the
+fixtures, so collecting or running only the GitHub tests never loads them.
 """
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def atlantis_service():
+    """
+    AtlantisService shared by every test in the session.
+
+    Caching is disabled so responses registered by one test are never served
+    to another; HTTP mocking stays per test via ``mocked_responses``.
+    """
+    from services.atlantis.atlantis import AtlantisService
+
+    service = AtlantisService(
+        base_url="https://atlantis.example.com", token="test-token", cache_ttl={}
+    )
+    yield service
+    service.close()
+
+
+@pytest.fixture
+def mocked_responses():
+    """Intercept requests made through ``requests`` for the duration of a test."""
+    responses = pytest.importorskip("responses")
+
+    with responses.RequestsMock() as rsps:
+        yield rsps
+
+
+@pytest.fixture
+def mock_github_class(monkeypatch):
+    """Replace the PyGithub client class used by GitHubService with a mock."""
+    from unittest.mock import MagicMock
+
+    mock = MagicMock()
+    monkeypatch.setattr("services.github.github.Github", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_github_instance(mock_github_class):
+    """The mocked Github client that GitHubService instances talk to."""
+    return mock_github_class.return_value
+
+
+@pytest.fixture
+def mock_repo(mock_github_instance):
+    """Mocked repository returned by every ``get_repo`` call."""
+    from unittest.mock import Mock
+
+    repo = Mock()
+    mock_github_instance.get_repo.return_value = repo
+    return repo
+
+
+@pytest.fixture
+def github_service(mock_github_class):
+    """GitHubService backed by the mocked Github client."""
+    from services.github.github import GitHubService
+
+    return GitHubService(token="ghp_test123")
+
+
+@pytest.fixture
+def svc_repo(github_service, mock_repo):
+    """The ``(github_service, mock_repo)`` pair most GitHub tests work with."""
+    return github_service, mock_repo
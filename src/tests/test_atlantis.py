@@ -4,447 +4,662 @@ Tests for Atlantis Service.
 Tests cover initialization, authentication, and all API methods.
 """
 
+import json
+import re
+from types import MappingProxyType
+
 import pytest
 import responses
-from unittest.mock import Mock, patch
-from requests.exceptions import RequestException, HTTPError
+from responses import matchers
+from unittest.mock import patch
+from requests.auth import HTTPBasicAuth
+from requests.exceptions import HTTPError
 
 from services.atlantis.atlantis import AtlantisService
 
+BASE_URL = "https://atlantis.example.com"
+API_URL = f"{BASE_URL}/api"
+TEST_URL = f"{API_URL}/test"
+PROJECTS_URL = f"{API_URL}/projects"
+PROJECT_URL = f"{API_URL}/project"
+PROJECT_STATUS_URL = f"{API_URL}/project/status"
+LOCKS_URL = f"{API_URL}/locks"
+EVENTS_URL = f"{API_URL}/events"
+VERSION_URL = f"{API_URL}/version"
+HEALTH_URL = f"{API_URL}/health"
+PLAN_URL = f"{API_URL}/plan"
+APPLY_URL = f"{API_URL}/apply"
+
+# Compiled once at import; responses matches patterns against the full URL
+TEST_URL_WITH_PARAMS = re.compile(rf"{re.escape(TEST_URL)}\?key=value$")
+
+# Response bodies shared between tests, read-only so no test can mutate them
+PROJECTS_BODY = MappingProxyType(
+    {"projects": [{"name": "project1"}, {"name": "project2"}]}
+)
+EMPTY_PROJECTS_BODY = MappingProxyType({"projects": []})
+VERSION_BODY = MappingProxyType({"version": "1.0.0"})
+HEALTH_BODY = MappingProxyType({"status": "healthy"})
+PLANNED_BODY = MappingProxyType({"status": "planned"})
+APPLIED_BODY = MappingProxyType({"status": "applied"})
+PROJECT_STATUS_BODY = MappingProxyType({"locks": [], "plans": [], "applies": []})
+LOCKS_BODY = MappingProxyType({"locks": [{"id": "lock1"}, {"id": "lock2"}]})
+EVENTS_BODY = MappingProxyType({"events": [{"id": "event1"}, {"id": "event2"}]})
+
+# Routes, relative to API_URL, registered once per class by routed_responses
+ROUTES = {
+    ("GET", "/projects"): (200, PROJECTS_BODY),
+    ("GET", "/project/status"): (200, PROJECT_STATUS_BODY),
+    ("GET", "/locks"): (200, LOCKS_BODY),
+    ("GET", "/events"): (200, EVENTS_BODY),
+    ("GET", "/version"): (200, VERSION_BODY),
+    ("GET", "/health"): (200, HEALTH_BODY),
+}
+
+# Plan/apply paths, a tuple so tests pass their own list(PATHS) copy
+PATHS = ({"Directory": ".", "Workspace": "default"},)
+
+_serialized_bodies = {}
+
+
+def json_body(body):
+    """Serialize a shared response body once and reuse the JSON text."""
+    text = _serialized_bodies.get(id(body))
+    if text is None:
+        text = _serialized_bodies[id(body)] = json.dumps(dict(body))
+    return text
+
+
+@pytest.fixture(scope="class")
+def routed_responses():
+    """
+    ROUTES registered once for the whole test class; tests read calls[-1].
+
+    Class scope keeps ``requests`` unpatched outside the classes that use it,
+    so other tests' ``mocked_responses`` still fail on unmatched requests.
+    """
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        for (method, path), (status, body) in ROUTES.items():
+            rsps.add(
+                method,
+                API_URL + path,
+                body=json_body(body),
+                content_type="application/json",
+                status=status,
+            )
+        yield rsps
+
+
+def _shared_post(url, body):
+    """Mock a POST endpoint for every test in a class; tests read calls[-1]."""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        rsps.add(
+            responses.POST,
+            url,
+            body=json_body(body),
+            content_type="application/json",
+            status=200,
+        )
+        yield rsps
+
+
+@pytest.fixture(scope="class")
+def plan_responses():
+    """Plan endpoint registered once for the whole test class."""
+    yield from _shared_post(PLAN_URL, PLANNED_BODY)
+
+
+@pytest.fixture(scope="class")
+def apply_responses():
+    """Apply endpoint registered once for the whole test class."""
+    yield from _shared_post(APPLY_URL, APPLIED_BODY)
+
+
+# (constructor kwargs, expected attributes, (exception, match) or None)
+INIT_CASES = [
+    (
+        {"base_url": BASE_URL, "token": "test-token"},
+        {
+            "base_url": BASE_URL,
+            "timeout": 30,
+            "verify_ssl": True,
+            "headers": {
+                "Accept": "application/json",
+                "X-Atlantis-Token": "test-token",
+                "Authorization": "Bearer test-token",
+            },
+            "auth": None,
+        },
+        None,
+    ),
+    (
+        {"base_url": BASE_URL, "username": "user", "password": "pass"},
+        {
+            "base_url": BASE_URL,
+            "headers": {"Accept": "application/json"},
+            "auth": HTTPBasicAuth("user", "pass"),
+        },
+        None,
+    ),
+    (
+        {"base_url": BASE_URL},
+        None,
+        (ValueError, "Either username/password or token"),
+    ),
+    (
+        {"base_url": "", "token": "test-token"},
+        None,
+        (ValueError, "base_url is required"),
+    ),
+    (
+        {"base_url": f"{BASE_URL}/", "token": "test-token"},
+        {"base_url": BASE_URL, "_api_base": API_URL},
+        None,
+    ),
+    (
+        {
+            "base_url": BASE_URL,
+            "token": "test-token",
+            "timeout": 60,
+            "verify_ssl": False,
+        },
+        {"timeout": 60, "verify_ssl": False},
+        None,
+    ),
+]
+
 
 class TestAtlantisServiceInit:
     """Test AtlantisService initialization."""
 
-    def test_init_with_token(self):
-        """Test initialization with token."""
+    @pytest.mark.parametrize(
+        "kwargs,attrs,raises",
+        INIT_CASES,
+        ids=[
+            "token",
+            "username_password",
+            "without_auth",
+            "without_base_url",
+            "strips_trailing_slash",
+            "custom_timeout_and_verify",
+        ],
+    )
+    def test_init(self, kwargs, attrs, raises):
+        """Test initialization attributes and argument validation."""
+        if raises:
+            with pytest.raises(raises[0], match=raises[1]):
+                AtlantisService(**kwargs)
+            return
+
+        service = AtlantisService(**kwargs)
+        for name, value in attrs.items():
+            assert getattr(service, name) == value
+
+    def test_init_configures_session(self):
+        """Test that a persistent session is configured with auth and headers."""
         service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-        assert service.base_url == "https://atlantis.example.com"
-        assert service.timeout == 30
-        assert service.verify_ssl is True
-        assert service.headers["X-Atlantis-Token"] == "test-token"
-        assert service.headers["Authorization"] == "Bearer test-token"
-        assert service.auth is None
-
-    def test_init_with_username_password(self):
-        """Test initialization with username and password."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com",
+            base_url=BASE_URL,
             username="user",
             password="pass",
+            verify_ssl=False,
         )
-        assert service.base_url == "https://atlantis.example.com"
-        assert service.auth is not None
-        assert "X-Atlantis-Token" not in service.headers
+        assert service._session.auth is service.auth
+        assert service._session.verify is False
 
-    def test_init_without_auth(self):
-        """Test initialization without authentication raises ValueError."""
-        with pytest.raises(ValueError, match="Either username/password or token"):
-            AtlantisService(base_url="https://atlantis.example.com")
+    def test_init_defers_session_creation(self):
+        """Test that the HTTP session is only created on first use."""
+        service = AtlantisService(base_url=BASE_URL, token="test-token")
+        assert "_session" not in service.__dict__
+        assert "_client" not in service.__dict__
 
-    def test_init_without_base_url(self):
-        """Test initialization without base_url raises ValueError."""
-        with pytest.raises(ValueError, match="base_url is required"):
-            AtlantisService(base_url="", token="test-token")
+        session = service._session
+        assert service._session is session
 
-    def test_init_strips_trailing_slash(self):
-        """Test that base_url trailing slash is stripped."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com/", token="test-token"
-        )
-        assert service.base_url == "https://atlantis.example.com"
+    def test_context_manager_closes_session(self):
+        """Test that leaving the context manager closes the session."""
+        service = AtlantisService(base_url=BASE_URL, token="test-token")
 
-    def test_init_custom_timeout_and_verify(self):
-        """Test initialization with custom timeout and verify_ssl."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com",
-            token="test-token",
-            timeout=60,
-            verify_ssl=False,
-        )
-        assert service.timeout == 60
-        assert service.verify_ssl is False
+        with patch.object(service._session, "close") as mock_close:
+            with service as entered:
+                assert entered is service
+                assert service._session.headers["X-Atlantis-Token"] == "test-token"
+
+        mock_close.assert_called_once()
 
 
 class TestAtlantisServiceMakeRequest:
     """Test _make_request method."""
 
-    @responses.activate
-    def test_make_request_success(self):
+    def test_make_request_success(self, mocked_responses, atlantis_service):
         """Test successful request."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/test",
+            TEST_URL,
             json={"status": "ok"},
             status=200,
         )
 
-        result = service._make_request("GET", "/api/test")
+        result = atlantis_service._make_request("GET", "/test")
         assert result == {"status": "ok"}
 
-    @responses.activate
-    def test_make_request_with_params(self):
+    def test_make_request_with_params(self, mocked_responses, atlantis_service):
         """Test request with query parameters."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/test",
+            TEST_URL_WITH_PARAMS,
             json={"param": "value"},
             status=200,
         )
 
-        result = service._make_request("GET", "/api/test", params={"key": "value"})
+        result = atlantis_service._make_request(
+            "GET", "/test", params={"key": "value"}
+        )
         assert result == {"param": "value"}
 
-    @responses.activate
-    def test_make_request_with_json_data(self):
+    def test_make_request_with_json_data(self, mocked_responses, atlantis_service):
         """Test request with JSON body."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.POST,
-            "https://atlantis.example.com/api/test",
+            TEST_URL,
             json={"created": True},
             status=200,
         )
 
-        result = service._make_request("POST", "/api/test", json_data={"data": "value"})
+        result = atlantis_service._make_request(
+            "POST", "/test", json_data={"data": "value"}
+        )
         assert result == {"created": True}
+        request = mocked_responses.calls[0].request
+        assert request.headers["Content-Type"] == "application/json"
+        assert json.loads(request.body) == {"data": "value"}
 
-    @responses.activate
-    def test_make_request_empty_response(self):
-        """Test request with empty response (204)."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
+    def test_make_request_sends_accept_json(self, mocked_responses, atlantis_service):
+        """Test that requests ask for JSON responses."""
+        mocked_responses.add(
+            responses.GET,
+            TEST_URL,
+            body=b'{"events": [{"id": "event1"}]}',
+            status=200,
         )
 
-        responses.add(
+        result = atlantis_service._make_request("GET", "/test")
+        assert result == {"events": [{"id": "event1"}]}
+        assert mocked_responses.calls[0].request.headers["Accept"] == "application/json"
+
+    def test_make_request_empty_response(self, mocked_responses, atlantis_service):
+        """Test request with empty response (204)."""
+        mocked_responses.add(
             responses.DELETE,
-            "https://atlantis.example.com/api/test",
+            TEST_URL,
             status=204,
         )
 
-        result = service._make_request("DELETE", "/api/test")
+        result = atlantis_service._make_request("DELETE", "/test")
         assert result == {}
 
-    @responses.activate
-    def test_make_request_http_error(self):
+    def test_make_request_http_error(self, mocked_responses, atlantis_service):
         """Test request that raises HTTPError."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/test",
+            TEST_URL,
             status=404,
         )
 
         with pytest.raises(HTTPError):
-            service._make_request("GET", "/api/test")
+            atlantis_service._make_request("GET", "/test")
 
 
 class TestAtlantisServiceProjects:
     """Test project-related methods."""
 
-    @responses.activate
-    def test_get_projects(self):
-        """Test getting all projects."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
-            responses.GET,
-            "https://atlantis.example.com/api/projects",
-            json={"projects": [{"name": "project1"}, {"name": "project2"}]},
-            status=200,
-        )
-
-        projects = service.get_projects()
-        assert len(projects) == 2
-        assert projects[0]["name"] == "project1"
-
-    @responses.activate
-    def test_get_projects_empty(self):
+    def test_get_projects_empty(self, mocked_responses, atlantis_service):
         """Test getting projects when none exist."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/projects",
-            json={"projects": []},
+            PROJECTS_URL,
+            body=json_body(EMPTY_PROJECTS_BODY),
+            content_type="application/json",
             status=200,
         )
 
-        projects = service.get_projects()
-        assert projects == []
+        assert atlantis_service.get_projects() == []
 
-    @responses.activate
-    def test_get_project(self):
+    def test_get_project(self, mocked_responses, atlantis_service):
         """Test getting a specific project."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/project?repo=owner%2Frepo",
+            PROJECT_URL,
             json={"name": "project1", "repo": "owner/repo"},
+            match=[matchers.query_param_matcher({"repo": "owner/repo"})],
             status=200,
         )
 
-        project = service.get_project(repo="owner/repo")
+        project = atlantis_service.get_project(repo="owner/repo")
         assert project["name"] == "project1"
 
-    @responses.activate
-    def test_get_project_with_project_and_branch(self):
+    def test_get_project_with_project_and_branch(
+        self, mocked_responses, atlantis_service
+    ):
         """Test getting a project with project and branch parameters."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/project?repo=owner%2Frepo&project=default&branch=main",
+            PROJECT_URL,
             json={"name": "default", "branch": "main"},
+            match=[
+                matchers.query_param_matcher(
+                    {"repo": "owner/repo", "project": "default", "branch": "main"}
+                )
+            ],
             status=200,
         )
 
-        project = service.get_project(
+        project = atlantis_service.get_project(
             repo="owner/repo", project="default", branch="main"
         )
         assert project["name"] == "default"
 
-    @responses.activate
-    def test_get_project_status(self):
-        """Test getting project status."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
-            responses.GET,
-            "https://atlantis.example.com/api/project/status?repo=owner%2Frepo",
-            json={"locks": [], "plans": [], "applies": []},
-            status=200,
-        )
-
-        status = service.get_project_status(repo="owner/repo")
-        assert "locks" in status
-        assert "plans" in status
-        assert "applies" in status
-
 
 class TestAtlantisServiceLocks:
     """Test lock-related methods."""
 
-    @responses.activate
-    def test_get_locks(self):
-        """Test getting all locks."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
-            responses.GET,
-            "https://atlantis.example.com/api/locks",
-            json={"locks": [{"id": "lock1"}, {"id": "lock2"}]},
-            status=200,
-        )
-
-        locks = service.get_locks()
-        assert len(locks) == 2
-
-    @responses.activate
-    def test_get_locks_with_repo(self):
+    def test_get_locks_with_repo(self, mocked_responses, atlantis_service):
         """Test getting locks for a specific repository."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/locks?repo=owner%2Frepo",
+            LOCKS_URL,
             json={"locks": [{"id": "lock1"}]},
+            match=[matchers.query_param_matcher({"repo": "owner/repo"})],
             status=200,
         )
 
-        locks = service.get_locks(repo="owner/repo")
+        locks = atlantis_service.get_locks(repo="owner/repo")
         assert len(locks) == 1
 
-    @responses.activate
-    def test_delete_lock(self):
+    def test_delete_lock(self, mocked_responses, atlantis_service):
         """Test deleting a lock."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.DELETE,
-            "https://atlantis.example.com/api/locks?id=lock1",
+            LOCKS_URL,
+            match=[matchers.query_param_matcher({"id": "lock1"})],
             status=204,
         )
 
-        result = service.delete_lock(lock_id="lock1")
-        assert result == {}
+        result = atlantis_service.delete_lock(lock_id="lock1")
+        assert result == {"ok": True, "id": "lock1"}
 
-    @responses.activate
-    def test_delete_lock_with_repo_and_project(self):
+    def test_delete_lock_with_repo_and_project(
+        self, mocked_responses, atlantis_service
+    ):
         """Test deleting a lock with repo and project."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
+        mocked_responses.add(
             responses.DELETE,
-            "https://atlantis.example.com/api/locks?id=lock1&repo=owner%2Frepo&project=default",
+            LOCKS_URL,
+            match=[
+                matchers.query_param_matcher(
+                    {"id": "lock1", "repo": "owner/repo", "project": "default"}
+                )
+            ],
             status=204,
         )
 
-        result = service.delete_lock(
+        result = atlantis_service.delete_lock(
             lock_id="lock1", repo="owner/repo", project="default"
         )
-        assert result == {}
+        assert result == {"ok": True, "id": "lock1"}
+
+    def test_delete_lock_ignores_body(self, mocked_responses, atlantis_service):
+        """Test deleting a lock does not parse the response body."""
+        mocked_responses.add(
+            responses.DELETE,
+            LOCKS_URL,
+            body="Deleted lock id lock1",
+            match=[matchers.query_param_matcher({"id": "lock1"})],
+            status=200,
+        )
+
+        result = atlantis_service.delete_lock(lock_id="lock1")
+        assert result == {"ok": True, "id": "lock1"}
+
+    def test_delete_lock_http_error(self, mocked_responses, atlantis_service):
+        """Test deleting a missing lock raises HTTPError."""
+        mocked_responses.add(
+            responses.DELETE,
+            LOCKS_URL,
+            match=[matchers.query_param_matcher({"id": "missing"})],
+            status=404,
+        )
+
+        with pytest.raises(HTTPError):
+            atlantis_service.delete_lock(lock_id="missing")
 
 
 class TestAtlantisServiceEvents:
     """Test event-related methods."""
 
-    @responses.activate
-    def test_get_events(self):
-        """Test getting events."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
+    def test_get_events_with_limit(self, mocked_responses, atlantis_service):
+        """Test getting events with limit."""
+        mocked_responses.add(
+            responses.GET,
+            EVENTS_URL,
+            json={"events": [{"id": "event1"}]},
+            match=[matchers.query_param_matcher({"limit": "5"})],
+            status=200,
         )
 
-        responses.add(
+        events = atlantis_service.get_events(limit=5)
+        assert len(events) == 1
+
+    def test_get_events_with_zero_limit(self, mocked_responses, atlantis_service):
+        """Test that a zero limit is still sent to the API."""
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/events",
-            json={"events": [{"id": "event1"}, {"id": "event2"}]},
+            EVENTS_URL,
+            json={"events": []},
+            match=[matchers.query_param_matcher({"limit": "0"})],
             status=200,
         )
 
-        events = service.get_events()
-        assert len(events) == 2
+        events = atlantis_service.get_events(limit=0)
+        assert events == []
+        assert mocked_responses.calls[0].request.url.endswith("?limit=0")
+
+
+# (method, kwargs (also the expected query params), expected result), served
+# by ROUTES
+SIMPLE_GETS = [
+    ("get_projects", {}, [{"name": "project1"}, {"name": "project2"}]),
+    ("get_project_status", {"repo": "owner/repo"}, dict(PROJECT_STATUS_BODY)),
+    ("get_locks", {}, [{"id": "lock1"}, {"id": "lock2"}]),
+    ("get_events", {}, [{"id": "event1"}, {"id": "event2"}]),
+    ("get_version", {}, VERSION_BODY),
+    ("get_health", {}, HEALTH_BODY),
+]
 
-    @responses.activate
-    def test_get_events_with_limit(self):
-        """Test getting events with limit."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
 
-        responses.add(
+class TestAtlantisServiceSimpleGets:
+    """Test GET endpoints that return a parsed field of the response."""
+
+    @pytest.mark.parametrize(
+        "method,kwargs,expected",
+        SIMPLE_GETS,
+        ids=["projects", "project_status", "locks", "events", "version", "health"],
+    )
+    def test_simple_get(
+        self, routed_responses, atlantis_service, method, kwargs, expected
+    ):
+        """Test that the endpoint is requested and its result returned."""
+        result = getattr(atlantis_service, method)(**kwargs)
+
+        assert result == expected
+        assert routed_responses.calls[-1].request.params == kwargs
+
+
+class TestAtlantisServiceCache:
+    """Test TTL caching of idempotent GET requests."""
+
+    def test_cached_get_skips_network(self, mocked_responses):
+        """Test that repeated cached GETs only hit the network once."""
+        service = AtlantisService(base_url=BASE_URL, token="test-token")
+
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/events?limit=5",
-            json={"events": [{"id": "event1"}]},
+            VERSION_URL,
+            body=json_body(VERSION_BODY),
+            content_type="application/json",
             status=200,
         )
 
-        events = service.get_events(limit=5)
-        assert len(events) == 1
+        first = service.get_version()
+        first["version"] = "mutated"
+        second = service.get_version()
 
+        assert second == VERSION_BODY
+        assert len(mocked_responses.calls) == 1
 
-class TestAtlantisServiceInfo:
-    """Test info-related methods (version, health)."""
-
-    @responses.activate
-    def test_get_version(self):
-        """Test getting version."""
+    def test_cache_expires(self, mocked_responses):
+        """Test that cached entries expire after their TTL."""
         service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
+            base_url=BASE_URL,
+            token="test-token",
+            cache_ttl={"/health": 10},
         )
 
-        responses.add(
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/version",
-            json={"version": "1.0.0"},
+            HEALTH_URL,
+            body=json_body(HEALTH_BODY),
+            content_type="application/json",
             status=200,
         )
 
-        version = service.get_version()
-        assert version["version"] == "1.0.0"
+        with patch("services.atlantis.atlantis.time.monotonic", return_value=100.0):
+            service.get_health()
+            service.get_health()
+        with patch("services.atlantis.atlantis.time.monotonic", return_value=111.0):
+            service.get_health()
 
-    @responses.activate
-    def test_get_health(self):
-        """Test getting health status."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
+        assert len(mocked_responses.calls) == 2
+
+    def test_clear_cache(self, mocked_responses):
+        """Test that clear_cache forces a new request."""
+        service = AtlantisService(base_url=BASE_URL, token="test-token")
+
+        mocked_responses.add(
+            responses.GET,
+            PROJECTS_URL,
+            body=json_body(EMPTY_PROJECTS_BODY),
+            content_type="application/json",
+            status=200,
         )
 
-        responses.add(
+        service.get_projects()
+        service.clear_cache()
+        service.get_projects()
+
+        assert len(mocked_responses.calls) == 2
+
+    def test_cache_disabled(self, mocked_responses):
+        """Test that an empty cache_ttl disables caching."""
+        service = AtlantisService(base_url=BASE_URL, token="test-token", cache_ttl={})
+
+        mocked_responses.add(
             responses.GET,
-            "https://atlantis.example.com/api/health",
-            json={"status": "healthy"},
+            VERSION_URL,
+            body=json_body(VERSION_BODY),
+            content_type="application/json",
             status=200,
         )
 
-        health = service.get_health()
-        assert health["status"] == "healthy"
+        service.get_version()
+        service.get_version()
 
+        assert len(mocked_responses.calls) == 2
 
-class TestAtlantisServicePlan:
-    """Test plan method."""
 
-    @responses.activate
-    def test_plan(self):
-        """Test executing a plan."""
+class TestAtlantisServiceHttpxTransport:
+    """Test the optional httpx (HTTP/2) transport."""
+
+    # Building the client loads the CA bundle into a fresh SSL context
+    @pytest.mark.fail_slow("1s")
+    def test_init_with_httpx_transport(self):
+        """Test that the httpx transport builds an HTTP/2 client."""
+        pytest.importorskip("httpx")
         service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
+            base_url=BASE_URL,
+            token="test-token",
+            transport="httpx",
+        )
+        assert service._client.headers["Accept-Encoding"] == "identity"
+        assert service._client.headers["X-Atlantis-Token"] == "test-token"
+        assert "_session" not in service.__dict__
+        service.close()
+
+    def test_init_with_invalid_transport(self):
+        """Test that an unknown transport raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported transport"):
+            AtlantisService(
+                base_url=BASE_URL,
+                token="test-token",
+                transport="urllib",
+            )
+
+    def test_make_request_with_httpx_transport(self):
+        """Test that requests are routed through the httpx client."""
+        httpx = pytest.importorskip("httpx")
+        service = AtlantisService(
+            base_url=BASE_URL,
+            token="test-token",
+            transport="httpx",
+            cache_ttl={},
         )
 
-        responses.add(
-            responses.POST,
-            "https://atlantis.example.com/api/plan",
-            json={"status": "planned"},
-            status=200,
+        def handler(request):
+            assert request.url == f"{LOCKS_URL}?repo=owner%2Frepo"
+            return httpx.Response(200, json={"locks": [{"id": "lock1"}]})
+
+        service._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+        assert service.get_locks(repo="owner/repo") == [{"id": "lock1"}]
+
+    def test_make_request_http_error_with_httpx_transport(self):
+        """Test that HTTP errors are raised by the httpx transport."""
+        httpx = pytest.importorskip("httpx")
+        service = AtlantisService(
+            base_url=BASE_URL,
+            token="test-token",
+            transport="httpx",
+        )
+        service._client = httpx.Client(
+            transport=httpx.MockTransport(lambda request: httpx.Response(404))
         )
 
-        paths = [{"Directory": ".", "Workspace": "default"}]
-        result = service.plan(
+        with pytest.raises(httpx.HTTPStatusError):
+            service._make_request("GET", "/test")
+
+
+class TestAtlantisServicePlan:
+    """Test plan method."""
+
+    def test_plan(self, plan_responses, atlantis_service):
+        """Test executing a plan."""
+        result = atlantis_service.plan(
             repository="owner/repo",
             ref="main",
             vcs_type="Github",
-            paths=paths,
+            paths=list(PATHS),
         )
 
         assert result["status"] == "planned"
-        request_body = responses.calls[0].request.body
+        request_body = plan_responses.calls[-1].request.body
         assert "Repository" in request_body.decode()
 
-    @responses.activate
-    def test_plan_with_pr_number(self):
+    def test_plan_with_pr_number(self, plan_responses, atlantis_service):
         """Test executing a plan with PR number."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
-            responses.POST,
-            "https://atlantis.example.com/api/plan",
-            json={"status": "planned"},
-            status=200,
-        )
-
-        paths = [{"Directory": ".", "Workspace": "default"}]
-        result = service.plan(
+        result = atlantis_service.plan(
             repository="owner/repo",
             ref="main",
             vcs_type="Github",
-            paths=paths,
+            paths=list(PATHS),
             pr_number=1,
         )
 
@@ -454,51 +669,28 @@ class TestAtlantisServicePlan:
 class TestAtlantisServiceApply:
     """Test apply method."""
 
-    @responses.activate
-    def test_apply(self):
+    def test_apply(self, apply_responses, atlantis_service):
         """Test executing an apply."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
-            responses.POST,
-            "https://atlantis.example.com/api/apply",
-            json={"status": "applied"},
-            status=200,
-        )
-
-        paths = [{"Directory": ".", "Workspace": "default"}]
-        result = service.apply(
+        result = atlantis_service.apply(
             repository="owner/repo",
             ref="main",
             vcs_type="Github",
-            paths=paths,
+            paths=list(PATHS),
         )
 
         assert result["status"] == "applied"
 
-    @responses.activate
-    def test_apply_with_pr_number(self):
+    def test_apply_with_pr_number(self, apply_responses, atlantis_service):
         """Test executing an apply with PR number."""
-        service = AtlantisService(
-            base_url="https://atlantis.example.com", token="test-token"
-        )
-
-        responses.add(
-            responses.POST,
-            "https://atlantis.example.com/api/apply",
-            json={"status": "applied"},
-            status=200,
-        )
-
-        paths = [{"Directory": ".", "Workspace": "default"}]
-        result = service.apply(
+        result = atlantis_service.apply(
             repository="owner/repo",
             ref="main",
             vcs_type="Github",
-            paths=paths,
+            paths=list(PATHS),
             pr_number=1,
         )
 
         assert result["status"] == "applied"
+        request_body = json.loads(apply_responses.calls[-1].request.body)
+        assert request_body["PR"] == 1
+        assert request_body["Paths"] == list(PATHS)
@@ -0,0 +1,170 @@
+"""
+Tests for Async Atlantis Service.
+
+Tests run against a local aiohttp test server so requests go over a real
+event loop and client session.
+"""
+
+import asyncio
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from aiohttp import web
+from aiohttp import test_utils
+
+from services.atlantis.atlantis_async import AsyncAtlantisService
+
+
+def run_with_server(routes, scenario):
+    """Start a test server with the given routes and run scenario(base_url)."""
+
+    async def main():
+        app = web.Application()
+        app.add_routes(routes)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        try:
+            return await scenario(str(server.make_url("")).rstrip("/"))
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestAsyncAtlantisServiceInit:
+    """Test AsyncAtlantisService initialization."""
+
+    def test_init_with_token(self):
+        """Test initialization with token."""
+        service = AsyncAtlantisService(
+            base_url="https://atlantis.example.com/", token="test-token"
+        )
+        assert service.base_url == "https://atlantis.example.com"
+        assert service.headers["X-Atlantis-Token"] == "test-token"
+        assert service.headers["Authorization"] == "Bearer test-token"
+
+    def test_init_with_username_password(self):
+        """Test initialization with username and password."""
+        service = AsyncAtlantisService(
+            base_url="https://atlantis.example.com",
+            username="user",
+            password="pass",
+        )
+        assert service.headers["Authorization"] == "Basic dXNlcjpwYXNz"
+        assert "X-Atlantis-Token" not in service.headers
+
+    def test_init_without_auth(self):
+        """Test initialization without authentication raises ValueError."""
+        with pytest.raises(ValueError, match="Either username/password or token"):
+            AsyncAtlantisService(base_url="https://atlantis.example.com")
+
+    def test_request_outside_context_manager(self):
+        """Test that requests outside ``async with`` raise RuntimeError."""
+        service = AsyncAtlantisService(
+            base_url="https://atlantis.example.com", token="test-token"
+        )
+        with pytest.raises(RuntimeError, match="async context manager"):
+            asyncio.run(service.get_version())
+
+
+class TestAsyncAtlantisServiceRequests:
+    """Test API methods against a local server."""
+
+    def test_get_projects_sends_token(self):
+        """Test getting projects sends the Atlantis token header."""
+        seen = {}
+
+        async def handler(request):
+            seen["token"] = request.headers.get("X-Atlantis-Token")
+            return web.json_response({"projects": [{"name": "project1"}]})
+
+        async def scenario(base_url):
+            async with AsyncAtlantisService(
+                base_url=base_url, token="test-token"
+            ) as service:
+                return await service.get_projects()
+
+        projects = run_with_server([web.get("/api/projects", handler)], scenario)
+        assert projects == [{"name": "project1"}]
+        assert seen["token"] == "test-token"
+
+    def test_delete_lock_empty_response(self):
+        """Test deleting a lock with an empty (204) response."""
+
+        async def handler(request):
+            assert request.query["id"] == "lock1"
+            return web.Response(status=204)
+
+        async def scenario(base_url):
+            async with AsyncAtlantisService(
+                base_url=base_url, token="test-token"
+            ) as service:
+                return await service.delete_lock(lock_id="lock1")
+
+        result = run_with_server([web.delete("/api/locks", handler)], scenario)
+        assert result == {"ok": True, "id": "lock1"}
+
+    def test_http_error(self):
+        """Test that HTTP errors are raised."""
+
+        async def scenario(base_url):
+            async with AsyncAtlantisService(
+                base_url=base_url, token="test-token"
+            ) as service:
+                return await service.get_version()
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            run_with_server([], scenario)
+
+    def test_plan_many(self):
+        """Test executing several plans concurrently preserves order."""
+        bodies = []
+
+        async def handler(request):
+            body = await request.json()
+            bodies.append(body)
+            return web.json_response({"repository": body["Repository"]})
+
+        paths = [{"Directory": ".", "Workspace": "default"}]
+        specs = [
+            {"repository": "owner/repo1", "ref": "main", "vcs_type": "Github", "paths": paths},
+            {
+                "repository": "owner/repo2",
+                "ref": "main",
+                "vcs_type": "Github",
+                "paths": paths,
+                "pr_number": 2,
+            },
+        ]
+
+        async def scenario(base_url):
+            async with AsyncAtlantisService(
+                base_url=base_url, token="test-token"
+            ) as service:
+                return await service.plan_many(specs)
+
+        results = run_with_server([web.post("/api/plan", handler)], scenario)
+        assert results == [{"repository": "owner/repo1"}, {"repository": "owner/repo2"}]
+        assert sorted(b.get("PR", 0) for b in bodies) == [0, 2]
+
+    def test_apply_many(self):
+        """Test executing several applies concurrently."""
+
+        async def handler(request):
+            return web.json_response({"status": "applied"})
+
+        paths = [{"Directory": ".", "Workspace": "default"}]
+        specs = [
+            {"repository": f"owner/repo{i}", "ref": "main", "vcs_type": "Github", "paths": paths}
+            for i in range(3)
+        ]
+
+        async def scenario(base_url):
+            async with AsyncAtlantisService(
+                base_url=base_url, token="test-token"
+            ) as service:
+                return await service.apply_many(specs)
+
+        results = run_with_server([web.post("/api/apply", handler)], scenario)
+        assert results == [{"status": "applied"}] * 3
@@ -3,105 +3,522 @@ Tests for GitHub Service.
 
 Tests cover initialization, repository operations, pull requests, webhooks,
 branch protection, labels, and comments.
+
+PyGithub is mocked throughout and no filesystem state is shared, so the
+tests are safe to run in parallel under pytest-xdist.
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch, PropertyMock
-from github import Github
-from github.Repository import Repository
-from github.PullRequest import PullRequest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from unittest.mock import Mock, create_autospec, patch
+from github import Auth
+from github.GithubRetry import GithubRetry
 from github.Branch import Branch
 from github.Label import Label
 from github.IssueComment import IssueComment
-from github.Hook import Hook
-from github.GithubException import GithubException
-
-from services.github.github import GitHubService
+from github.GithubException import GithubException, RateLimitExceededException
+from github.GithubObject import NotSet
+
+from services.github.github import (
+    GitHubService,
+    PullRequestBundle,
+    _ConditionalRequestHook,
+)
+
+# No test in this module may reach the real Github client
+pytestmark = pytest.mark.usefixtures("mock_github_class")
+
+def _mock_branch():
+    """Return a fresh Branch mock autospecced against PyGithub's Branch."""
+    return create_autospec(Branch, instance=True)
+
+
+@pytest.fixture
+def git_push_mocks(mock_repo):
+    """Git data objects returned by ``mock_repo`` while pushing files."""
+    mocks = SimpleNamespace(
+        blob=SimpleNamespace(sha="blob_sha"),
+        commit=SimpleNamespace(sha="commit_sha", tree=SimpleNamespace(sha="tree_sha")),
+        ref=Mock(object=SimpleNamespace(sha="ref_sha")),
+        new_tree=SimpleNamespace(),
+        new_commit=SimpleNamespace(sha="new_commit_sha"),
+    )
+
+    mock_repo.get_git_ref.return_value = mocks.ref
+    mock_repo.get_git_commit.return_value = mocks.commit
+    mock_repo.create_git_blob.return_value = mocks.blob
+    mock_repo.create_git_tree.return_value = mocks.new_tree
+    mock_repo.create_git_commit.return_value = mocks.new_commit
+    return mocks
 
 
 class TestGitHubServiceInit:
     """Test GitHubService initialization."""
 
-    @patch("services.github.github.Github")
-    def test_init_with_token(self, mock_github_class):
-        """Test initialization with token."""
-        mock_github_instance = Mock()
-        mock_github_class.return_value = mock_github_instance
+    @pytest.mark.parametrize(
+        "kwargs,attrs,github_kwargs",
+        [
+            (
+                {"token": "ghp_test123"},
+                {"token": "ghp_test123", "timeout": 30, "verify": True},
+                {"verify": True, "timeout": 30, "pool_size": 50},
+            ),
+            (
+                {
+                    "token": "ghp_test123",
+                    "base_url": "https://github.example.com/api/v3",
+                },
+                {"token": "ghp_test123"},
+                {
+                    "base_url": "https://github.example.com/api/v3",
+                    "verify": True,
+                    "timeout": 30,
+                    "pool_size": 50,
+                },
+            ),
+            (
+                {"token": "ghp_test123", "timeout": 60, "verify": False},
+                {"timeout": 60, "verify": False},
+                {"verify": False, "timeout": 60, "pool_size": 50},
+            ),
+        ],
+        ids=["token", "base_url", "custom_timeout_and_verify"],
+    )
+    def test_init(self, mock_github_class, kwargs, attrs, github_kwargs):
+        """Test initialization attributes and the arguments passed to Github."""
+        service = GitHubService(**kwargs)
+        for name, value in attrs.items():
+            assert getattr(service, name) == value
+
+        mock_github_class.assert_called_once()
+        passed = dict(mock_github_class.call_args.kwargs)
+        auth = passed.pop("auth")
+        assert isinstance(auth, Auth.Token)
+        assert auth.token == "ghp_test123"
+        passed.pop("retry")
+        assert passed == github_kwargs
+
+    def test_init_configures_retry_and_pool(self, mock_github_class):
+        """Test initialization configures retries and connection pool size."""
+        service = GitHubService(token="ghp_test123", pool_size=10)
+
+        kwargs = mock_github_class.call_args.kwargs
+        assert isinstance(kwargs["retry"], GithubRetry)
+        assert kwargs["retry"].total == 3
+        assert kwargs["retry"].backoff_factor == 0.3
+        assert kwargs["pool_size"] == 10
+        assert service.pool_size == 10
+
+    @pytest.mark.parametrize("token", ["", None])
+    def test_init_without_token(self, token):
+        """Test initialization without token raises ValueError."""
+        with pytest.raises(ValueError, match="token is required"):
+            GitHubService(token=token)
+
+    def test_init_uses_slots(self, github_service):
+        """Test that instances have no __dict__ and reject unknown attributes."""
+        assert not hasattr(github_service, "__dict__")
+        with pytest.raises(AttributeError):
+            github_service.unknown = True
+
+
+class TestConditionalRequestHook:
+    """Test ETag-based conditional request handling."""
+
+    def test_init_installs_hook(self, github_service):
+        """Test that the service wraps the requester's requestJson."""
+        hook = github_service.github.requester.requestJson
+        assert isinstance(hook, _ConditionalRequestHook)
+        assert hook.cache is github_service._etag_cache
+
+    def test_caches_etag_and_serves_304_from_cache(self):
+        """Test that a 304 response is answered with the cached body."""
+        request_json = Mock(
+            side_effect=[
+                (200, {"etag": '"abc"'}, '{"id": 1}'),
+                (304, {"etag": '"abc"'}, ""),
+            ]
+        )
+        hook = _ConditionalRequestHook(request_json, {})
+
+        first = hook("GET", "/repos/octocat/Hello-World")
+        second = hook("GET", "/repos/octocat/Hello-World")
+
+        assert first == (200, {"etag": '"abc"'}, '{"id": 1}')
+        assert second == (200, {"etag": '"abc"'}, '{"id": 1}')
+        second_headers = request_json.call_args_list[1][0][3]
+        assert second_headers == {"If-None-Match": '"abc"'}
+
+    def test_refreshes_cache_on_modified_response(self):
+        """Test that a new 200 response replaces the cached entry."""
+        request_json = Mock(
+            side_effect=[
+                (200, {"etag": '"v1"'}, '{"id": 1}'),
+                (200, {"etag": '"v2"'}, '{"id": 2}'),
+            ]
+        )
+        cache = {}
+        hook = _ConditionalRequestHook(request_json, cache)
+
+        hook("GET", "/repos/octocat/Hello-World/labels", {"page": 1})
+        result = hook("GET", "/repos/octocat/Hello-World/labels", {"page": 1})
+
+        assert result[2] == '{"id": 2}'
+        assert list(cache.values())[0][0] == '"v2"'
+
+    def test_falls_back_to_last_modified(self):
+        """Test revalidation with If-Modified-Since when there is no ETag."""
+        last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+        request_json = Mock(
+            side_effect=[
+                (200, {"last-modified": last_modified}, "[]"),
+                (304, {}, ""),
+            ]
+        )
+        hook = _ConditionalRequestHook(request_json, {})
+
+        hook("GET", "/repos/octocat/Hello-World/issues/1/comments")
+        result = hook("GET", "/repos/octocat/Hello-World/issues/1/comments")
+
+        assert result == (200, {"last-modified": last_modified}, "[]")
+        second_headers = request_json.call_args_list[1][0][3]
+        assert second_headers == {"If-Modified-Since": last_modified}
+
+    def test_sends_both_validators(self):
+        """Test that both validators are sent when both were cached."""
+        request_json = Mock(
+            return_value=(
+                200,
+                {"etag": '"abc"', "last-modified": "Wed, 21 Oct 2015 07:28:00 GMT"},
+                "{}",
+            )
+        )
+        hook = _ConditionalRequestHook(request_json, {})
+
+        hook("GET", "/repos/octocat/Hello-World")
+        hook("GET", "/repos/octocat/Hello-World")
+
+        second_headers = request_json.call_args_list[1][0][3]
+        assert second_headers == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 21 Oct 2015 07:28:00 GMT",
+        }
+
+    def test_non_get_requests_pass_through(self):
+        """Test that non-GET requests are neither cached nor conditional."""
+        request_json = Mock(return_value=(201, {"etag": '"abc"'}, "{}"))
+        cache = {}
+        hook = _ConditionalRequestHook(request_json, cache)
 
-        service = GitHubService(token="ghp_test123")
-        assert service.token == "ghp_test123"
-        assert service.timeout == 30
-        assert service.verify is True
-        mock_github_class.assert_called_once_with(
-            login_or_token="ghp_test123", verify=True, timeout=30
+        hook("POST", "/repos/octocat/Hello-World/labels", None, None, {"name": "bug"})
+
+        assert cache == {}
+        request_json.assert_called_once_with(
+            "POST", "/repos/octocat/Hello-World/labels", None, None, {"name": "bug"}
         )
 
-    @patch("services.github.github.Github")
-    def test_init_with_base_url(self, mock_github_class):
-        """Test initialization with base_url (GitHub Enterprise)."""
-        mock_github_instance = Mock()
-        mock_github_class.return_value = mock_github_instance
+    def test_evicts_oldest_entry_when_full(self):
+        """Test that the cache is bounded."""
+        request_json = Mock(return_value=(200, {"etag": '"abc"'}, "{}"))
+        cache = {}
+        hook = _ConditionalRequestHook(request_json, cache, max_entries=2)
+
+        for url in ("/a", "/b", "/c"):
+            hook("GET", url)
+
+        assert [key[0] for key in cache] == ["/b", "/c"]
+
+    def test_concurrent_requests_keep_cache_bounded(self):
+        """Test that concurrent GETs from pool workers never overfill the cache."""
+        request_json = Mock(return_value=(200, {"etag": '"abc"'}, "{}"))
+        cache = {}
+        hook = _ConditionalRequestHook(request_json, cache, max_entries=4)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda i: hook("GET", f"/items/{i}"), range(200)))
+
+        assert len(cache) == 4
+        assert request_json.call_count == 200
 
-        service = GitHubService(
-            token="ghp_test123", base_url="https://github.example.com/api/v3"
+    def test_records_rate_limit_headers(self, github_service):
+        """Test that rate limit headers are tracked and exposed on the service."""
+        assert github_service.rate_limit is None
+
+        hook = github_service._request_hook
+        hook._request_json = Mock(
+            return_value=(
+                200,
+                {"x-ratelimit-remaining": "4999", "x-ratelimit-reset": "1700000000"},
+                "{}",
+            )
         )
-        mock_github_class.assert_called_once_with(
-            base_url="https://github.example.com/api/v3",
-            login_or_token="ghp_test123",
-            verify=True,
-            timeout=30,
+        hook("POST", "/repos/octocat/Hello-World/labels")
+
+        assert hook.rate_limits == {"core": (4999, 1700000000)}
+        assert github_service.rate_limit == {"remaining": 4999, "reset": 1700000000}
+
+    @patch("services.github.github.time.sleep")
+    @patch("services.github.github.time.time", return_value=1000.0)
+    def test_waits_for_reset_when_nearly_exhausted(
+        self, mock_time, mock_sleep, caplog
+    ):
+        """Test that requests wait for the reset once the limit is nearly used."""
+        request_json = Mock(
+            return_value=(
+                200,
+                {"x-ratelimit-remaining": "2", "x-ratelimit-reset": "1030"},
+                "{}",
+            )
         )
+        hook = _ConditionalRequestHook(request_json, {}, min_remaining=5)
+
+        hook("GET", "/a")
+        mock_sleep.assert_not_called()
+
+        with caplog.at_level("WARNING", logger="services.github.github"):
+            hook("GET", "/b")
+        mock_sleep.assert_called_once_with(30.0)
+        assert "waiting 30.0s" in caplog.text
+
+    @patch("services.github.github.time.sleep")
+    @patch("services.github.github.time.time", return_value=1000.0)
+    def test_tracks_budgets_per_resource(self, mock_time, mock_sleep):
+        """Test that GraphQL and core REST budgets do not overwrite each other."""
+        request_json = Mock(
+            side_effect=[
+                (
+                    200,
+                    {
+                        "x-ratelimit-resource": "core",
+                        "x-ratelimit-remaining": "2",
+                        "x-ratelimit-reset": "1030",
+                    },
+                    "{}",
+                ),
+                (
+                    200,
+                    {
+                        "x-ratelimit-resource": "graphql",
+                        "x-ratelimit-remaining": "4000",
+                        "x-ratelimit-reset": "4600",
+                    },
+                    "{}",
+                ),
+                (200, {}, "{}"),
+                (
+                    200,
+                    {
+                        "x-ratelimit-resource": "graphql",
+                        "x-ratelimit-remaining": "3999",
+                        "x-ratelimit-reset": "4600",
+                    },
+                    "{}",
+                ),
+            ]
+        )
+        hook = _ConditionalRequestHook(request_json, {}, min_remaining=5)
+
+        hook("GET", "/repos/octocat/Hello-World")
+        # The nearly exhausted core budget does not hold up GraphQL
+        hook("POST", "/graphql")
+        mock_sleep.assert_not_called()
+
+        # ...and a healthy GraphQL budget does not hide the core one
+        hook("GET", "/repos/octocat/Hello-World/labels")
+        mock_sleep.assert_called_once_with(30.0)
+
+        hook("POST", "https://github.example.com/api/graphql")
+        mock_sleep.assert_called_once()
+        assert hook.rate_limits == {"graphql": (3999, 4600)}
+
+    @patch("services.github.github.time.sleep")
+    @patch("services.github.github.time.time", return_value=1000.0)
+    def test_raises_when_reset_is_beyond_max_wait(self, mock_time, mock_sleep):
+        """Test that a wait longer than max_wait raises instead of blocking."""
+        request_json = Mock(
+            return_value=(
+                200,
+                {"x-ratelimit-remaining": "2", "x-ratelimit-reset": "4600"},
+                "{}",
+            )
+        )
+        hook = _ConditionalRequestHook(request_json, {}, min_remaining=5, max_wait=60)
+
+        hook("GET", "/a")
+        with pytest.raises(RateLimitExceededException, match="resets in 3600s"):
+            hook("GET", "/b")
+
+        mock_sleep.assert_not_called()
+        assert request_json.call_count == 1
+
+    @patch("services.github.github.time.sleep")
+    @patch("services.github.github.time.time", return_value=1000.0)
+    def test_does_not_wait_with_budget_left(self, mock_time, mock_sleep):
+        """Test that requests are not delayed while enough budget remains."""
+        request_json = Mock(
+            return_value=(
+                200,
+                {"x-ratelimit-remaining": "100", "x-ratelimit-reset": "1030"},
+                "{}",
+            )
+        )
+        hook = _ConditionalRequestHook(request_json, {})
 
-    @patch("services.github.github.Github")
-    def test_init_without_token(self, mock_github_class):
-        """Test initialization without token raises ValueError."""
-        with pytest.raises(ValueError, match="token is required"):
-            GitHubService(token="")
-
-    @patch("services.github.github.Github")
-    def test_init_custom_timeout_and_verify(self, mock_github_class):
-        """Test initialization with custom timeout and verify."""
-        mock_github_instance = Mock()
-        mock_github_class.return_value = mock_github_instance
+        hook("GET", "/a")
+        hook("GET", "/b")
 
-        service = GitHubService(token="ghp_test123", timeout=60, verify=False)
-        assert service.timeout == 60
-        assert service.verify is False
+        mock_sleep.assert_not_called()
 
 
 class TestGitHubServiceRepository:
     """Test repository-related methods."""
 
-    @patch("services.github.github.Github")
-    def test_get_repository(self, mock_github_class):
+    def test_get_repository(self, mock_github_instance, mock_repo, github_service):
         """Test getting a repository."""
-        mock_repo = Mock(spec=Repository)
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        repo = service.get_repository(owner="octocat", repo="Hello-World")
+        repo = github_service.get_repository(owner="octocat", repo="Hello-World")
 
         assert repo == mock_repo
         mock_github_instance.get_repo.assert_called_once_with("octocat/Hello-World")
 
+    def test_get_repository_is_memoized(self, mock_github_instance, github_service):
+        """Test that repeated lookups reuse the hydrated repository."""
+        first = github_service.get_repository(owner="octocat", repo="Hello-World")
+        second = github_service.get_repository(owner="octocat", repo="Hello-World")
+
+        assert first is second
+        mock_github_instance.get_repo.assert_called_once_with("octocat/Hello-World")
+
+    def test_invalidate_repo(self, mock_github_instance, github_service):
+        """Test that invalidating a repository forces a new lookup."""
+        mock_github_instance.get_repo.side_effect = [
+            Mock(),
+            Mock(),
+        ]
+
+        first = github_service.get_repository(owner="octocat", repo="Hello-World")
+        github_service.invalidate_repo(owner="octocat", repo="Hello-World")
+        second = github_service.get_repository(owner="octocat", repo="Hello-World")
+
+        assert first is not second
+        assert mock_github_instance.get_repo.call_count == 2
+
+    @patch("services.github.github._REPO_CACHE_SIZE", 2)
+    def test_repository_cache_is_bounded(self, mock_github_instance, github_service):
+        """Test that the least recently used repository is evicted."""
+        mock_github_instance.get_repo.side_effect = lambda name: Mock(name=name)
+
+        github_service.get_repository(owner="octocat", repo="a")
+        github_service.get_repository(owner="octocat", repo="b")
+        github_service.get_repository(owner="octocat", repo="a")
+        github_service.get_repository(owner="octocat", repo="c")
+
+        assert list(github_service._repo_cache) == [("octocat", "a"), ("octocat", "c")]
+
+
+class TestBoundRepoService:
+    """Test repository-bound service views."""
+
+    def test_bind_hydrates_repository(
+        self, mock_github_instance, mock_repo, github_service
+    ):
+        """Test that binding fetches the repository once up front."""
+        bound = github_service.bind(owner="octocat", repo="Hello-World")
+
+        assert bound.repository is mock_repo
+        mock_github_instance.get_repo.assert_called_once_with("octocat/Hello-World")
+
+    def test_bound_methods_apply_owner_and_repo(
+        self, mock_github_instance, mock_repo, github_service
+    ):
+        """Test that bound methods forward owner and repo."""
+        mock_pr = Mock()
+        mock_repo.get_pull.return_value = mock_pr
+
+        bound = github_service.bind(owner="octocat", repo="Hello-World")
+
+        assert bound.get_pull_request(pr_number=1) is mock_pr
+        assert bound.get_pull_request is bound.get_pull_request
+        bound.add_label_to_pull_request(pr_number=1, label_name="bug")
+        mock_github_instance.requester.requestJsonAndCheck.assert_called_once_with(
+            "POST",
+            "/repos/octocat/Hello-World/issues/1/labels",
+            input={"labels": ["bug"]},
+        )
+
+    def test_bound_rejects_unscoped_methods(self, github_service):
+        """Test that methods not scoped to a repository are not exposed."""
+        bound = github_service.bind(owner="octocat", repo="Hello-World")
+
+        with pytest.raises(AttributeError):
+            bound.prefetch_pages
+        with pytest.raises(AttributeError):
+            bound.bind
+
+
+class TestGitHubServiceListings:
+    """Test methods that list repository resources."""
+
+    @pytest.mark.parametrize(
+        "method,kwargs,mock_path",
+        [
+            ("get_webhooks", {}, "get_hooks"),
+            ("get_labels", {}, "get_labels"),
+            (
+                "get_pull_request_comments",
+                {"pr_number": 1},
+                "get_pull.return_value.get_issue_comments",
+            ),
+        ],
+        ids=["webhooks", "labels", "pull_request_comments"],
+    )
+    def test_list_method(self, mock_repo, github_service, method, kwargs, mock_path):
+        """Test that listing methods return everything the repository yields."""
+        items = [Mock(), Mock()]
+        target = mock_repo
+        for name in mock_path.split("."):
+            target = getattr(target, name)
+        target.return_value = items
+
+        result = getattr(github_service, method)(
+            owner="octocat", repo="Hello-World", **kwargs
+        )
+
+        assert len(result) == 2
+        assert result == items
+
+    def test_prefetch_pages(self, github_service):
+        """Test prefetching pages concurrently keeps page order."""
+        mock_paginated = Mock()
+        mock_paginated.get_page.side_effect = lambda page: [
+            f"item{page}a",
+            f"item{page}b",
+        ]
+
+        items = github_service.prefetch_pages(mock_paginated, pages=3)
+
+        assert items == ["item0a", "item0b", "item1a", "item1b", "item2a", "item2b"]
+        assert mock_paginated.get_page.call_count == 3
+
+    def test_prefetch_zero_pages(self, github_service):
+        """Test prefetching zero pages issues no requests."""
+        mock_paginated = Mock()
+
+        assert github_service.prefetch_pages(mock_paginated, pages=0) == []
+        mock_paginated.get_page.assert_not_called()
+
 
 class TestGitHubServiceWebhooks:
     """Test webhook-related methods."""
 
-    @patch("services.github.github.Github")
-    def test_create_webhook(self, mock_github_class):
+    def test_create_webhook(self, svc_repo):
         """Test creating a webhook."""
-        mock_hook = Mock(spec=Hook)
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_hook = Mock()
         mock_repo.create_hook.return_value = mock_hook
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        webhook = service.create_webhook(
+        webhook = github_service.create_webhook(
             owner="octocat",
             repo="Hello-World",
             url="https://example.com/webhook",
@@ -109,81 +526,62 @@ class TestGitHubServiceWebhooks:
         )
 
         assert webhook == mock_hook
-        mock_repo.create_hook.assert_called_once()
-        call_kwargs = mock_repo.create_hook.call_args[1]
-        assert call_kwargs["name"] == "web"
-        assert call_kwargs["config"]["url"] == "https://example.com/webhook"
-        assert call_kwargs["events"] == ["push", "pull_request"]
-
-    @patch("services.github.github.Github")
-    def test_create_webhook_with_secret(self, mock_github_class):
+        mock_repo.create_hook.assert_called_once_with(
+            name="web",
+            config={"url": "https://example.com/webhook", "content_type": "json"},
+            events=["push", "pull_request"],
+            active=True,
+        )
+
+    def test_create_webhook_with_secret(self, svc_repo):
         """Test creating a webhook with secret."""
-        mock_hook = Mock(spec=Hook)
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_hook = Mock()
         mock_repo.create_hook.return_value = mock_hook
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        webhook = service.create_webhook(
+        webhook = github_service.create_webhook(
             owner="octocat",
             repo="Hello-World",
             url="https://example.com/webhook",
             secret="secret123",
         )
 
-        call_kwargs = mock_repo.create_hook.call_args[1]
-        assert call_kwargs["config"]["secret"] == "secret123"
-
-    @patch("services.github.github.Github")
-    def test_get_webhooks(self, mock_github_class):
-        """Test getting all webhooks."""
-        mock_hooks = [Mock(spec=Hook), Mock(spec=Hook)]
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_hooks.return_value = mock_hooks
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        webhooks = service.get_webhooks(owner="octocat", repo="Hello-World")
-
-        assert len(webhooks) == 2
-        assert webhooks == mock_hooks
-
-    @patch("services.github.github.Github")
-    def test_delete_webhook(self, mock_github_class):
-        """Test deleting a webhook."""
-        mock_hook = Mock(spec=Hook)
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_hook.return_value = mock_hook
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
+        mock_repo.create_hook.assert_called_once_with(
+            name="web",
+            config={
+                "url": "https://example.com/webhook",
+                "content_type": "json",
+                "secret": "secret123",
+            },
+            events=["*"],
+            active=True,
+        )
 
-        service = GitHubService(token="ghp_test123")
-        result = service.delete_webhook(owner="octocat", repo="Hello-World", hook_id=123)
+    def test_delete_webhook(self, mock_github_instance, github_service):
+        """Test deleting a webhook without fetching it first."""
+        result = github_service.delete_webhook(
+            owner="octocat", repo="Hello-World", hook_id=123
+        )
 
         assert result is True
-        mock_hook.delete.assert_called_once()
+        mock_github_instance.requester.requestJsonAndCheck.assert_called_once_with(
+            "DELETE", "/repos/octocat/Hello-World/hooks/123"
+        )
+        mock_github_instance.get_repo.assert_not_called()
 
 
 class TestGitHubServicePullRequests:
     """Test pull request-related methods."""
 
-    @patch("services.github.github.Github")
-    def test_create_pull_request(self, mock_github_class):
+    def test_create_pull_request(self, svc_repo):
         """Test creating a pull request."""
-        mock_pr = Mock(spec=PullRequest)
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_pr = Mock()
         mock_repo.create_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        pr = service.create_pull_request(
+        pr = github_service.create_pull_request(
             owner="octocat",
             repo="Hello-World",
             title="Test PR",
@@ -201,18 +599,14 @@ class TestGitHubServicePullRequests:
             draft=False,
         )
 
-    @patch("services.github.github.Github")
-    def test_create_pull_request_draft(self, mock_github_class):
+    def test_create_pull_request_draft(self, svc_repo):
         """Test creating a draft pull request."""
-        mock_pr = Mock(spec=PullRequest)
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_pr = Mock()
         mock_repo.create_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        pr = service.create_pull_request(
+        pr = github_service.create_pull_request(
             owner="octocat",
             repo="Hello-World",
             title="Test PR",
@@ -224,52 +618,117 @@ class TestGitHubServicePullRequests:
         call_kwargs = mock_repo.create_pull.call_args[1]
         assert call_kwargs["draft"] is True
 
-    @patch("services.github.github.Github")
-    def test_get_pull_request(self, mock_github_class):
+    def test_get_pull_request(self, svc_repo):
         """Test getting a pull request."""
-        mock_pr = Mock(spec=PullRequest)
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_pr = Mock()
         mock_repo.get_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        pr = service.get_pull_request(owner="octocat", repo="Hello-World", pr_number=1)
+        pr = github_service.get_pull_request(
+            owner="octocat", repo="Hello-World", pr_number=1
+        )
 
         assert pr == mock_pr
         mock_repo.get_pull.assert_called_once_with(1)
 
-    @patch("services.github.github.Github")
-    def test_get_pull_requests(self, mock_github_class):
+    def test_get_pull_request_bundle(self, mock_github_instance, github_service):
+        """Test getting a pull request with labels and comments via GraphQL."""
+        mock_github_instance.requester.graphql_query.return_value = (
+            {},
+            {
+                "data": {
+                    "repository": {
+                        "pullRequest": {
+                            "number": 1,
+                            "title": "Add feature",
+                            "body": "Description",
+                            "state": "OPEN",
+                            "labels": {"nodes": [{"name": "bug", "color": "d73a4a"}]},
+                            "comments": {
+                                "nodes": [
+                                    {"databaseId": 10, "body": "LGTM", "author": {"login": "octocat"}},
+                                    {"databaseId": 11, "body": "Old", "author": None},
+                                ]
+                            },
+                        }
+                    }
+                }
+            },
+        )
+
+        bundle = github_service.get_pull_request_bundle(
+            owner="octocat", repo="Hello-World", pr_number=1
+        )
+
+        assert isinstance(bundle, PullRequestBundle)
+        assert bundle.number == 1
+        assert bundle.title == "Add feature"
+        assert bundle.state == "open"
+        assert bundle.merged is False
+        assert bundle.labels == [{"name": "bug", "color": "d73a4a"}]
+        assert bundle.comments == [
+            {"id": 10, "body": "LGTM", "author": "octocat"},
+            {"id": 11, "body": "Old", "author": None},
+        ]
+        query, variables = mock_github_instance.requester.graphql_query.call_args.args
+        assert "pullRequest(number: $number)" in query
+        assert variables == {"owner": "octocat", "repo": "Hello-World", "number": 1}
+        mock_github_instance.get_repo.assert_not_called()
+
+    def test_get_pull_request_bundle_merged(
+        self, mock_github_instance, github_service
+    ):
+        """Test that a merged pull request is reported as closed and merged."""
+        mock_github_instance.requester.graphql_query.return_value = (
+            {},
+            {
+                "data": {
+                    "repository": {
+                        "pullRequest": {
+                            "number": 2,
+                            "title": "Merged",
+                            "body": "",
+                            "state": "MERGED",
+                            "labels": {"nodes": []},
+                            "comments": {"nodes": []},
+                        }
+                    }
+                }
+            },
+        )
+
+        bundle = github_service.get_pull_request_bundle(
+            owner="octocat", repo="Hello-World", pr_number=2
+        )
+
+        assert bundle.state == "closed"
+        assert bundle.merged is True
+
+    def test_get_pull_requests(self, svc_repo):
         """Test getting pull requests."""
-        mock_prs = [Mock(spec=PullRequest), Mock(spec=PullRequest)]
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_prs = [Mock(), Mock()]
         mock_repo.get_pulls.return_value = mock_prs
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        prs = service.get_pull_requests(
+        prs = github_service.get_pull_requests(
             owner="octocat", repo="Hello-World", state="open"
         )
 
         assert len(prs) == 2
-        mock_repo.get_pulls.assert_called_once_with(state="open", base=None, head=None)
+        mock_repo.get_pulls.assert_called_once_with(
+            state="open", base=NotSet, head=NotSet
+        )
 
-    @patch("services.github.github.Github")
-    def test_get_pull_requests_with_filters(self, mock_github_class):
+    def test_get_pull_requests_with_filters(self, svc_repo):
         """Test getting pull requests with base and head filters."""
-        mock_prs = [Mock(spec=PullRequest)]
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_prs = [Mock()]
         mock_repo.get_pulls.return_value = mock_prs
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        prs = service.get_pull_requests(
+        prs = github_service.get_pull_requests(
             owner="octocat",
             repo="Hello-World",
             state="open",
@@ -281,48 +740,49 @@ class TestGitHubServicePullRequests:
             state="open", base="main", head="feature-branch"
         )
 
+    def test_iter_pull_requests_streams_pages(
+        self, mock_github_instance, mock_repo, github_service
+    ):
+        """Test streaming pull requests fetches pages until a short page."""
+        pages = [["pr1", "pr2"], ["pr3", "pr4"], ["pr5"]]
+        mock_paginated = Mock()
+        mock_paginated.get_page.side_effect = lambda page: pages[page]
+        mock_repo.get_pulls.return_value = mock_paginated
+        mock_github_instance.per_page = 2
+
+        prs = github_service.iter_pull_requests(owner="octocat", repo="Hello-World")
+
+        assert next(prs) == "pr1"
+        assert mock_paginated.get_page.call_count == 1
+        assert list(prs) == ["pr2", "pr3", "pr4", "pr5"]
+        assert mock_paginated.get_page.call_count == 3
+
+    def test_iter_pull_requests_empty(
+        self, mock_github_instance, mock_repo, github_service
+    ):
+        """Test streaming pull requests of a repository without any."""
+        mock_paginated = Mock()
+        mock_paginated.get_page.return_value = []
+        mock_repo.get_pulls.return_value = mock_paginated
+        mock_github_instance.per_page = 30
+
+        prs = github_service.iter_pull_requests(owner="octocat", repo="Hello-World")
+        assert list(prs) == []
+        mock_paginated.get_page.assert_called_once_with(0)
+
 
 class TestGitHubServiceBranchOperations:
     """Test branch-related operations."""
 
-    @patch("services.github.github.Github")
-    @patch("github.InputGitTreeElement")
-    def test_push_to_pull_request(self, mock_tree_element, mock_github_class):
+    @patch("services.github.github.InputGitTreeElement")
+    def test_push_to_pull_request(
+        self, mock_tree_element, mock_repo, git_push_mocks, github_service
+    ):
         """Test pushing a file to a branch."""
-        # Setup mocks
-        mock_blob = Mock()
-        mock_blob.sha = "blob_sha"
         mock_tree_element_instance = Mock()
         mock_tree_element.return_value = mock_tree_element_instance
 
-        mock_tree = Mock()
-        mock_tree.tree = [Mock(path="other_file.py", mode="100644", type="blob", sha="old_sha")]
-
-        mock_commit = Mock()
-        mock_commit.tree.sha = "tree_sha"
-        mock_commit.sha = "commit_sha"
-
-        mock_ref = Mock()
-        mock_ref.object.sha = "ref_sha"
-
-        mock_new_tree = Mock()
-        mock_new_commit = Mock()
-        mock_new_commit.sha = "new_commit_sha"
-
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_git_ref.return_value = mock_ref
-        mock_repo.get_git_commit.return_value = mock_commit
-        mock_repo.get_git_tree.return_value = mock_tree
-        mock_repo.create_git_blob.return_value = mock_blob
-        mock_repo.create_git_tree.return_value = mock_new_tree
-        mock_repo.create_git_commit.return_value = mock_new_commit
-
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        result = service.push_to_pull_request(
+        result = github_service.push_to_pull_request(
             owner="octocat",
             repo="Hello-World",
             branch="feature-branch",
@@ -335,27 +795,27 @@ class TestGitHubServiceBranchOperations:
         assert result["commit_sha"] == "new_commit_sha"
         assert result["branch"] == "feature-branch"
         assert result["file_path"] == "src/new_file.py"
-        mock_ref.edit.assert_called_once_with("new_commit_sha")
+        git_push_mocks.ref.edit.assert_called_once_with("new_commit_sha")
+
+        # Only the changed file is sent, layered onto the commit's own tree
+        mock_repo.get_git_tree.assert_not_called()
+        mock_tree_element.assert_called_once_with(
+            "src/new_file.py", "100644", "blob", sha="blob_sha"
+        )
+        mock_repo.create_git_tree.assert_called_once_with(
+            [mock_tree_element_instance], base_tree=git_push_mocks.commit.tree
+        )
 
-    @patch("services.github.github.Github")
-    def test_create_branch(self, mock_github_class):
+    def test_create_branch(self, svc_repo):
         """Test creating a new branch."""
-        mock_base_ref = Mock()
-        mock_base_ref.object.sha = "base_sha"
+        github_service, mock_repo = svc_repo
 
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_git_ref.side_effect = [
-            GithubException(404, "Not found"),  # Branch doesn't exist
-            mock_base_ref,  # Base branch exists
-        ]
+        mock_repo.get_git_ref.return_value = SimpleNamespace(
+            object=SimpleNamespace(sha="base_sha")
+        )
         mock_repo.create_git_ref = Mock()
 
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        result = service.create_branch(
+        result = github_service.create_branch(
             owner="octocat",
             repo="Hello-World",
             branch="feature/new-branch",
@@ -365,90 +825,83 @@ class TestGitHubServiceBranchOperations:
         assert result["branch"] == "feature/new-branch"
         assert result["base_branch"] == "main"
         assert result["commit_sha"] == "base_sha"
+        mock_repo.get_git_ref.assert_called_once_with("heads/main")
         mock_repo.create_git_ref.assert_called_once_with(
             "refs/heads/feature/new-branch", "base_sha"
         )
 
-    @patch("services.github.github.Github")
-    def test_create_branch_already_exists(self, mock_github_class):
-        """Test creating a branch that already exists raises ValueError."""
-        mock_ref = Mock()
-        mock_repo = Mock(spec=Repository)
-        # First call (checking if branch exists) returns the ref (branch exists)
-        # This should raise ValueError
-        mock_repo.get_git_ref.return_value = mock_ref
-
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        with pytest.raises(ValueError, match="already exists"):
-            service.create_branch(
-                owner="octocat",
-                repo="Hello-World",
-                branch="existing-branch",
-                base_branch="main",
+    @pytest.mark.parametrize(
+        "mock_attr,error,method,kwargs,match",
+        [
+            (
+                "create_git_ref",
+                GithubException(422, {"message": "Reference already exists"}),
+                "create_branch",
+                {"branch": "existing-branch", "base_branch": "main"},
+                "already exists",
+            ),
+            (
+                "get_git_ref",
+                GithubException(404, "Not found"),
+                "create_branch",
+                {"branch": "new-branch", "base_branch": "nonexistent"},
+                "Base branch",
+            ),
+            (
+                "get_git_ref",
+                GithubException(404, "Not found"),
+                "push_files_to_branch",
+                {
+                    "branch": "nonexistent",
+                    "files": {"file.py": "content"},
+                    "message": "Add file",
+                },
+                "Branch",
+            ),
+        ],
+        ids=[
+            "create_branch_already_exists",
+            "create_branch_base_not_found",
+            "push_files_to_branch_not_found",
+        ],
+    )
+    def test_ref_error_raises_value_error(
+        self, mock_repo, github_service, mock_attr, error, method, kwargs, match
+    ):
+        """Test that missing or conflicting refs raise ValueError."""
+        getattr(mock_repo, mock_attr).side_effect = error
+
+        with pytest.raises(ValueError, match=match):
+            getattr(github_service, method)(
+                owner="octocat", repo="Hello-World", **kwargs
             )
 
-    @patch("services.github.github.Github")
-    def test_create_branch_base_not_found(self, mock_github_class):
-        """Test creating a branch with non-existent base raises ValueError."""
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_git_ref.side_effect = [
-            GithubException(404, "Not found"),  # Branch doesn't exist (good)
-            GithubException(404, "Not found"),  # Base branch doesn't exist (bad)
-        ]
-
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        with pytest.raises(ValueError, match="Base branch"):
-            service.create_branch(
+    @pytest.mark.parametrize(
+        "error",
+        [
+            GithubException(403, "Forbidden"),
+            GithubException(422, {"message": "Reference name is invalid"}),
+        ],
+        ids=["forbidden", "invalid_ref_name"],
+    )
+    def test_create_branch_other_error_propagates(self, svc_repo, error):
+        """Test that errors other than a duplicate ref are re-raised."""
+        github_service, mock_repo = svc_repo
+
+        mock_repo.get_git_ref.return_value = Mock()
+        mock_repo.create_git_ref.side_effect = error
+
+        with pytest.raises(GithubException):
+            github_service.create_branch(
                 owner="octocat",
                 repo="Hello-World",
                 branch="new-branch",
-                base_branch="nonexistent",
+                base_branch="main",
             )
 
-    @patch("services.github.github.Github")
-    @patch("github.InputGitTreeElement")
-    def test_push_files_to_branch(self, mock_tree_element, mock_github_class):
+    def test_push_files_to_branch(self, git_push_mocks, github_service):
         """Test pushing multiple files to a branch."""
-        mock_blob = Mock()
-        mock_blob.sha = "blob_sha"
-        mock_tree_element_instance = Mock()
-        mock_tree_element.return_value = mock_tree_element_instance
-
-        mock_tree = Mock()
-        mock_tree.tree = [Mock(path="other_file.py", mode="100644", type="blob", sha="old_sha")]
-
-        mock_commit = Mock()
-        mock_commit.tree.sha = "tree_sha"
-
-        mock_branch_ref = Mock()
-        mock_branch_ref.object.sha = "ref_sha"
-
-        mock_new_tree = Mock()
-        mock_new_commit = Mock()
-        mock_new_commit.sha = "new_commit_sha"
-
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_git_ref.return_value = mock_branch_ref
-        mock_repo.get_git_commit.return_value = mock_commit
-        mock_repo.get_git_tree.return_value = mock_tree
-        mock_repo.create_git_blob.return_value = mock_blob
-        mock_repo.create_git_tree.return_value = mock_new_tree
-        mock_repo.create_git_commit.return_value = mock_new_commit
-
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        result = service.push_files_to_branch(
+        result = github_service.push_files_to_branch(
             owner="octocat",
             repo="Hello-World",
             branch="feature-branch",
@@ -462,43 +915,45 @@ class TestGitHubServiceBranchOperations:
         assert "file1.py" in result["files"]
         assert "file2.py" in result["files"]
 
-    @patch("services.github.github.Github")
-    def test_push_files_to_branch_not_found(self, mock_github_class):
-        """Test pushing files to non-existent branch raises ValueError."""
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_git_ref.side_effect = GithubException(404, "Not found")
+    @patch("services.github.github.InputGitTreeElement")
+    def test_push_files_to_branch_blob_order(
+        self, mock_tree_element, mock_repo, git_push_mocks, github_service
+    ):
+        """Test concurrently created blobs are matched to their file paths."""
+        mock_repo.create_git_blob.side_effect = lambda content, encoding: (
+            SimpleNamespace(sha=f"sha-{content}")
+        )
 
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
+        files = {f"file{i}.py": f"content{i}" for i in range(20)}
+        github_service.push_files_to_branch(
+            owner="octocat",
+            repo="Hello-World",
+            branch="feature-branch",
+            files=files,
+            message="Add files",
+        )
 
-        service = GitHubService(token="ghp_test123")
-        with pytest.raises(ValueError, match="Branch"):
-            service.push_files_to_branch(
-                owner="octocat",
-                repo="Hello-World",
-                branch="nonexistent",
-                files={"file.py": "content"},
-                message="Add file",
-            )
+        assert mock_repo.create_git_blob.call_count == 20
+        assert [
+            (c.args, c.kwargs) for c in mock_tree_element.call_args_list
+        ] == [
+            ((path, "100644", "blob"), {"sha": f"sha-{content}"})
+            for path, content in files.items()
+        ]
 
 
 class TestGitHubServiceBranchProtection:
     """Test branch protection methods."""
 
-    @patch("services.github.github.Github")
-    def test_update_branch_protection(self, mock_github_class):
+    def test_update_branch_protection(self, svc_repo):
         """Test updating branch protection."""
-        mock_branch = Mock(spec=Branch)
-        mock_branch.protect = Mock()  # Add protect method explicitly
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_branch = _mock_branch()
+        mock_branch.protect = Mock()  # Not part of Branch, so not autospecced
         mock_repo.get_branch.return_value = mock_branch
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        result = service.update_branch_protection(
+        result = github_service.update_branch_protection(
             owner="octocat",
             repo="Hello-World",
             branch="main",
@@ -509,25 +964,22 @@ class TestGitHubServiceBranchProtection:
         assert result == mock_branch
         mock_branch.protect.assert_called_once()
 
-    @patch("services.github.github.Github")
-    def test_get_branch_protection(self, mock_github_class):
+    def test_get_branch_protection(self, svc_repo):
         """Test getting branch protection."""
-        mock_protection = Mock()
-        mock_protection.required_status_checks = {"strict": True}
-        mock_protection.enforce_admins = True
-        mock_protection.required_pull_request_reviews = {"count": 1}
-        mock_protection.restrictions = {"users": []}
+        github_service, mock_repo = svc_repo
 
-        mock_branch = Mock(spec=Branch)
+        mock_protection = SimpleNamespace(
+            required_status_checks={"strict": True},
+            enforce_admins=True,
+            required_pull_request_reviews={"count": 1},
+            restrictions={"users": []},
+        )
+
+        mock_branch = _mock_branch()
         mock_branch.get_protection.return_value = mock_protection
-        mock_repo = Mock(spec=Repository)
         mock_repo.get_branch.return_value = mock_branch
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        protection = service.get_branch_protection(
+        protection = github_service.get_branch_protection(
             owner="octocat", repo="Hello-World", branch="main"
         )
 
@@ -537,21 +989,102 @@ class TestGitHubServiceBranchProtection:
         assert "restrictions" in protection
 
 
+class TestGitHubServiceReadCache:
+    """Test TTL memoization of branch protection and label reads."""
+
+    @pytest.fixture
+    def wired_repo(self, mock_repo):
+        """``mock_repo`` serving a protected branch and fresh label lists."""
+        mock_branch = _mock_branch()
+        mock_branch.get_protection.return_value = SimpleNamespace(
+            required_status_checks=None,
+            enforce_admins=True,
+            required_pull_request_reviews=None,
+            restrictions=None,
+        )
+        mock_branch.protect = Mock()
+        mock_repo.get_branch.return_value = mock_branch
+        mock_repo.get_labels.side_effect = lambda: [Mock()]
+        return mock_repo, mock_branch
+
+    def test_branch_protection_is_memoized(self, wired_repo, github_service):
+        """Test repeated protection reads within the TTL hit the API once."""
+        _, mock_branch = wired_repo
+
+        first = github_service.get_branch_protection("octocat", "Hello-World", "main")
+        first["enforce_admins"] = False
+        second = github_service.get_branch_protection("octocat", "Hello-World", "main")
+
+        assert second["enforce_admins"] is True
+        mock_branch.get_protection.assert_called_once()
+
+    def test_update_branch_protection_invalidates(self, wired_repo, github_service):
+        """Test updating protection drops the memoized rules."""
+        _, mock_branch = wired_repo
+
+        github_service.get_branch_protection("octocat", "Hello-World", "main")
+        github_service.update_branch_protection("octocat", "Hello-World", "main")
+        github_service.get_branch_protection("octocat", "Hello-World", "main")
+
+        assert mock_branch.get_protection.call_count == 2
+
+    def test_labels_are_memoized_until_expiry(self, wired_repo):
+        """Test label reads are reused until the TTL elapses."""
+        mock_repo, _ = wired_repo
+        # Like PaginatedList, nothing is fetched until the labels are iterated
+        fetch_page = Mock(side_effect=lambda: [Mock(), Mock()])
+        mock_repo.get_labels.side_effect = lambda: (
+            label for label in fetch_page()
+        )
+        service = GitHubService(token="ghp_test123", cache_ttl=30)
+
+        with patch("services.github.github.time.monotonic", return_value=1000.0):
+            first = service.get_labels("octocat", "Hello-World")
+            second = service.get_labels("octocat", "Hello-World")
+            assert second == first
+            assert len(second) == 2
+
+        assert fetch_page.call_count == 1
+
+        with patch("services.github.github.time.monotonic", return_value=1031.0):
+            assert service.get_labels("octocat", "Hello-World") != first
+
+        assert fetch_page.call_count == 2
+
+    def test_create_label_invalidates(self, wired_repo, github_service):
+        """Test creating a label drops the memoized labels."""
+        mock_repo, _ = wired_repo
+
+        github_service.get_labels("octocat", "Hello-World")
+        github_service.create_label(
+            "octocat", "Hello-World", name="bug", color="d73a4a"
+        )
+        github_service.get_labels("octocat", "Hello-World")
+
+        assert mock_repo.get_labels.call_count == 2
+
+    def test_zero_ttl_disables_memoization(self, wired_repo):
+        """Test cache_ttl=0 always re-fetches."""
+        mock_repo, _ = wired_repo
+        service = GitHubService(token="ghp_test123", cache_ttl=0)
+
+        service.get_labels("octocat", "Hello-World")
+        service.get_labels("octocat", "Hello-World")
+
+        assert mock_repo.get_labels.call_count == 2
+
+
 class TestGitHubServiceLabels:
     """Test label-related methods."""
 
-    @patch("services.github.github.Github")
-    def test_create_label(self, mock_github_class):
+    def test_create_label(self, svc_repo):
         """Test creating a label."""
-        mock_label = Mock(spec=Label)
-        mock_repo = Mock(spec=Repository)
+        github_service, mock_repo = svc_repo
+
+        mock_label = Mock()
         mock_repo.create_label.return_value = mock_label
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        label = service.create_label(
+        label = github_service.create_label(
             owner="octocat",
             repo="Hello-World",
             name="bug",
@@ -564,116 +1097,105 @@ class TestGitHubServiceLabels:
             name="bug", color="d73a4a", description="Something isn't working"
         )
 
-    @patch("services.github.github.Github")
-    def test_get_labels(self, mock_github_class):
-        """Test getting all labels."""
-        mock_labels = [Mock(spec=Label), Mock(spec=Label)]
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_labels.return_value = mock_labels
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        labels = service.get_labels(owner="octocat", repo="Hello-World")
-
-        assert len(labels) == 2
-        assert labels == mock_labels
-
-    @patch("services.github.github.Github")
-    def test_add_label_to_pull_request(self, mock_github_class):
-        """Test adding a label to a pull request."""
-        mock_pr = Mock(spec=PullRequest)
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        result = service.add_label_to_pull_request(
-            owner="octocat", repo="Hello-World", pr_number=1, label_name="bug"
+    @pytest.mark.parametrize(
+        "method,label_name,expected_args,expected_kwargs",
+        [
+            (
+                "add_label_to_pull_request",
+                "bug",
+                ("POST", "/repos/octocat/Hello-World/issues/1/labels"),
+                {"input": {"labels": ["bug"]}},
+            ),
+            (
+                "remove_label_from_pull_request",
+                "needs review",
+                (
+                    "DELETE",
+                    "/repos/octocat/Hello-World/issues/1/labels/needs%20review",
+                ),
+                {},
+            ),
+            (
+                "remove_label_from_pull_request",
+                "area/api",
+                ("DELETE", "/repos/octocat/Hello-World/issues/1/labels/area%2Fapi"),
+                {},
+            ),
+        ],
+        ids=["add", "remove", "remove_with_slash"],
+    )
+    def test_pull_request_label_change(
+        self,
+        mock_github_instance,
+        github_service,
+        method,
+        label_name,
+        expected_args,
+        expected_kwargs,
+    ):
+        """Test changing pull request labels via the Issues API."""
+        result = getattr(github_service, method)(
+            owner="octocat", repo="Hello-World", pr_number=1, label_name=label_name
         )
 
         assert result is True
-        mock_pr.add_to_labels.assert_called_once_with("bug")
-
-    @patch("services.github.github.Github")
-    def test_remove_label_from_pull_request(self, mock_github_class):
-        """Test removing a label from a pull request."""
-        mock_pr = Mock(spec=PullRequest)
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        result = service.remove_label_from_pull_request(
-            owner="octocat", repo="Hello-World", pr_number=1, label_name="bug"
+        mock_github_instance.requester.requestJsonAndCheck.assert_called_once_with(
+            *expected_args, **expected_kwargs
         )
+        mock_github_instance.get_repo.assert_not_called()
 
-        assert result is True
-        mock_pr.remove_from_labels.assert_called_once_with("bug")
-
-    @patch("services.github.github.Github")
-    def test_get_pull_request_labels(self, mock_github_class):
-        """Test getting labels for a pull request."""
-        mock_labels = [Mock(spec=Label), Mock(spec=Label)]
-        mock_pr = Mock(spec=PullRequest)
-        mock_pr.get_labels.return_value = mock_labels
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
+    @patch("services.github.github.PaginatedList")
+    def test_get_pull_request_labels(
+        self, mock_paginated_list, mock_github_instance, github_service
+    ):
+        """Test getting labels for a pull request via the Issues API."""
+        mock_labels = [Mock(), Mock()]
+        mock_paginated_list.return_value = mock_labels
 
-        service = GitHubService(token="ghp_test123")
-        labels = service.get_pull_request_labels(
+        labels = github_service.get_pull_request_labels(
             owner="octocat", repo="Hello-World", pr_number=1
         )
 
         assert len(labels) == 2
         assert labels == mock_labels
+        mock_paginated_list.assert_called_once_with(
+            Label,
+            mock_github_instance.requester,
+            "/repos/octocat/Hello-World/issues/1/labels",
+            None,
+        )
+        mock_github_instance.get_repo.assert_not_called()
 
 
 class TestGitHubServiceComments:
     """Test comment-related methods."""
 
-    @patch("services.github.github.Github")
-    def test_create_pull_request_comment(self, mock_github_class):
+    def test_create_pull_request_comment(self, svc_repo):
         """Test creating a regular PR comment."""
-        mock_comment = Mock(spec=IssueComment)
-        mock_pr = Mock(spec=PullRequest)
+        github_service, mock_repo = svc_repo
+
+        mock_comment = Mock()
+        mock_pr = Mock()
         mock_pr.create_issue_comment.return_value = mock_comment
-        mock_repo = Mock(spec=Repository)
         mock_repo.get_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        comment = service.create_pull_request_comment(
+        comment = github_service.create_pull_request_comment(
             owner="octocat", repo="Hello-World", pr_number=1, body="Great work!"
         )
 
         assert comment == mock_comment
         mock_pr.create_issue_comment.assert_called_once_with("Great work!")
 
-    @patch("services.github.github.Github")
-    def test_create_pull_request_review_comment(self, mock_github_class):
+    def test_create_pull_request_review_comment(self, svc_repo):
         """Test creating a review comment (line comment)."""
-        mock_comment = Mock(spec=IssueComment)
-        mock_pr = Mock(spec=PullRequest)
+        github_service, mock_repo = svc_repo
+
+        mock_comment = Mock()
+        mock_pr = Mock()
         mock_pr.create_review_comment.return_value = mock_comment
-        mock_repo = Mock(spec=Repository)
         mock_repo.get_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
 
-        service = GitHubService(token="ghp_test123")
-        comment = service.create_pull_request_comment(
+        comment = github_service.create_pull_request_comment(
             owner="octocat",
             repo="Hello-World",
             pr_number=1,
@@ -693,64 +1215,39 @@ class TestGitHubServiceComments:
             side="RIGHT",
         )
 
-    @patch("services.github.github.Github")
-    def test_get_pull_request_comments(self, mock_github_class):
-        """Test getting all comments for a pull request."""
-        mock_comments = [Mock(spec=IssueComment), Mock(spec=IssueComment)]
-        mock_pr = Mock(spec=PullRequest)
-        mock_pr.get_issue_comments.return_value = mock_comments
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_pull.return_value = mock_pr
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        comments = service.get_pull_request_comments(
-            owner="octocat", repo="Hello-World", pr_number=1
+    def test_update_pull_request_comment(self, mock_github_instance, github_service):
+        """Test updating a pull request comment without fetching it first."""
+        mock_github_instance.requester.requestJsonAndCheck.return_value = (
+            {},
+            {"id": 123456, "body": "Updated comment"},
         )
 
-        assert len(comments) == 2
-        assert comments == mock_comments
-
-    @patch("services.github.github.Github")
-    def test_update_pull_request_comment(self, mock_github_class):
-        """Test updating a pull request comment."""
-        mock_updated_comment = Mock(spec=IssueComment)
-        mock_comment = Mock(spec=IssueComment)
-        mock_comment.edit.return_value = mock_updated_comment
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_issue_comment = Mock(return_value=mock_comment)  # Add method explicitly
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
-
-        service = GitHubService(token="ghp_test123")
-        result = service.update_pull_request_comment(
+        result = github_service.update_pull_request_comment(
             owner="octocat",
             repo="Hello-World",
             comment_id=123456,
             body="Updated comment",
         )
 
-        assert result == mock_updated_comment
-        mock_comment.edit.assert_called_once_with("Updated comment")
-
-    @patch("services.github.github.Github")
-    def test_delete_pull_request_comment(self, mock_github_class):
-        """Test deleting a pull request comment."""
-        mock_comment = Mock(spec=IssueComment)
-        mock_repo = Mock(spec=Repository)
-        mock_repo.get_issue_comment = Mock(return_value=mock_comment)  # Add method explicitly
-        mock_github_instance = Mock()
-        mock_github_instance.get_repo.return_value = mock_repo
-        mock_github_class.return_value = mock_github_instance
+        assert isinstance(result, IssueComment)
+        assert result.id == 123456
+        assert result.body == "Updated comment"
+        mock_github_instance.requester.requestJsonAndCheck.assert_called_once_with(
+            "PATCH",
+            "/repos/octocat/Hello-World/issues/comments/123456",
+            input={"body": "Updated comment"},
+        )
+        mock_github_instance.get_repo.assert_not_called()
 
-        service = GitHubService(token="ghp_test123")
-        result = service.delete_pull_request_comment(
+    def test_delete_pull_request_comment(self, mock_github_instance, github_service):
+        """Test deleting a pull request comment without fetching it first."""
+        result = github_service.delete_pull_request_comment(
             owner="octocat", repo="Hello-World", comment_id=123456
         )
 
         assert result is True
-        mock_comment.delete.assert_called_once()
+        mock_github_instance.requester.requestJsonAndCheck.assert_called_once_with(
+            "DELETE", "/repos/octocat/Hello-World/issues/comments/123456"
+        )
+        mock_github_instance.get_repo.assert_not_called()
 
@@ -0,0 +1,338 @@
+"""
+Tests for Async GitHub Service.
+
+Tests run against a local aiohttp test server so requests go over a real
+event loop and client session.
+"""
+
+import asyncio
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from aiohttp import web
+from aiohttp import test_utils
+
+from services.github.github_async import AsyncGitHubService
+
+
+def run_with_server(routes, scenario):
+    """Start a test server with the given routes and run scenario(base_url)."""
+
+    async def main():
+        app = web.Application()
+        app.add_routes(routes)
+        server = test_utils.TestServer(app)
+        await server.start_server()
+        try:
+            return await scenario(str(server.make_url("")).rstrip("/"))
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+class TestAsyncGitHubServiceInit:
+    """Test AsyncGitHubService initialization."""
+
+    def test_init_with_token(self):
+        """Test initialization with token only."""
+        service = AsyncGitHubService(token="test-token")
+        assert service.base_url == "https://api.github.com"
+        assert service.headers["Authorization"] == "Bearer test-token"
+
+    def test_init_with_base_url(self):
+        """Test initialization with custom base URL."""
+        service = AsyncGitHubService(
+            token="test-token", base_url="https://github.example.com/api/v3/"
+        )
+        assert service.base_url == "https://github.example.com/api/v3"
+
+    def test_init_without_token(self):
+        """Test initialization without token raises ValueError."""
+        with pytest.raises(ValueError, match="token is required"):
+            AsyncGitHubService(token="")
+
+    def test_request_outside_context_manager(self):
+        """Test that requests outside ``async with`` raise RuntimeError."""
+        service = AsyncGitHubService(token="test-token")
+        with pytest.raises(RuntimeError, match="async context manager"):
+            asyncio.run(service.get_repository("owner", "repo"))
+
+
+class TestAsyncGitHubServiceRequests:
+    """Test API methods against a local server."""
+
+    def test_get_repository_sends_token(self):
+        """Test getting a repository sends the authorization header."""
+        seen = {}
+
+        async def handler(request):
+            seen["auth"] = request.headers.get("Authorization")
+            return web.json_response({"full_name": "owner/repo"})
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(token="test-token", base_url=base_url) as service:
+                return await service.get_repository("owner", "repo")
+
+        repo = run_with_server([web.get("/repos/owner/repo", handler)], scenario)
+        assert repo == {"full_name": "owner/repo"}
+        assert seen["auth"] == "Bearer test-token"
+
+    def test_get_pull_requests_fetches_all_pages(self):
+        """Test that remaining pages are fetched after the first."""
+        seen_pages = []
+
+        async def handler(request):
+            page = int(request.query["page"])
+            seen_pages.append(page)
+            assert request.query["state"] == "open"
+            assert "base" not in request.query
+            headers = {}
+            if page == 1:
+                headers["Link"] = (
+                    f'<{request.url.with_query(page=2)}>; rel="next", '
+                    f'<{request.url.with_query(page=3)}>; rel="last"'
+                )
+            return web.json_response([{"number": page}], headers=headers)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(token="test-token", base_url=base_url) as service:
+                return await service.get_pull_requests("owner", "repo")
+
+        pulls = run_with_server([web.get("/repos/owner/repo/pulls", handler)], scenario)
+        assert pulls == [{"number": 1}, {"number": 2}, {"number": 3}]
+        assert sorted(seen_pages) == [1, 2, 3]
+
+    def test_delete_webhook(self):
+        """Test deleting a webhook with an empty (204) response."""
+
+        async def handler(request):
+            return web.Response(status=204)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(token="test-token", base_url=base_url) as service:
+                return await service.delete_webhook("owner", "repo", 123)
+
+        result = run_with_server([web.delete("/repos/owner/repo/hooks/123", handler)], scenario)
+        assert result is True
+
+    @pytest.mark.parametrize(
+        "label_name,encoded",
+        [("needs review", "needs%20review"), ("a/b", "a%2Fb"), ("x?y", "x%3Fy")],
+    )
+    def test_remove_label_quotes_name(self, label_name, encoded):
+        """Test that label names are percent-encoded into the URL path."""
+        seen = {}
+
+        async def handler(request):
+            seen["path"] = request.raw_path
+            return web.Response(status=204)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(token="test-token", base_url=base_url) as service:
+                return await service.remove_label_from_pull_request(
+                    "owner", "repo", 1, label_name
+                )
+
+        routes = [web.delete("/repos/owner/repo/issues/1/labels/{name:.*}", handler)]
+        assert run_with_server(routes, scenario) is True
+        assert seen["path"] == f"/repos/owner/repo/issues/1/labels/{encoded}"
+
+    def test_create_branch_already_exists(self):
+        """Test creating a branch that already exists raises ValueError."""
+
+        async def get_ref(request):
+            return web.json_response({"object": {"sha": "base-sha"}})
+
+        async def create_ref(request):
+            return web.json_response({"message": "Reference already exists"}, status=422)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(token="test-token", base_url=base_url) as service:
+                return await service.create_branch("owner", "repo", "feature", "main")
+
+        routes = [
+            web.get("/repos/owner/repo/git/ref/heads/main", get_ref),
+            web.post("/repos/owner/repo/git/refs", create_ref),
+        ]
+        with pytest.raises(ValueError, match="already exists"):
+            run_with_server(routes, scenario)
+
+    def test_create_branch_invalid_ref_name(self):
+        """Test that other 422 validation errors are re-raised unchanged."""
+
+        async def get_ref(request):
+            return web.json_response({"object": {"sha": "base-sha"}})
+
+        async def create_ref(request):
+            return web.json_response({"message": "Reference name is invalid"}, status=422)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(token="test-token", base_url=base_url) as service:
+                return await service.create_branch("owner", "repo", "a..b", "main")
+
+        routes = [
+            web.get("/repos/owner/repo/git/ref/heads/main", get_ref),
+            web.post("/repos/owner/repo/git/refs", create_ref),
+        ]
+        with pytest.raises(aiohttp.ClientResponseError, match="is invalid") as exc_info:
+            run_with_server(routes, scenario)
+        assert exc_info.value.status == 422
+
+    def test_push_files_to_branch(self):
+        """Test pushing multiple files creates blobs and a single commit."""
+        blobs = []
+        seen = {}
+
+        async def get_ref(request):
+            return web.json_response({"object": {"sha": "head-sha"}})
+
+        async def get_commit(request):
+            return web.json_response({"sha": "head-sha", "tree": {"sha": "base-tree-sha"}})
+
+        async def create_blob(request):
+            body = await request.json()
+            blobs.append(body["content"])
+            return web.json_response({"sha": f"blob-{body['content']}"}, status=201)
+
+        async def create_tree(request):
+            seen["tree"] = await request.json()
+            return web.json_response({"sha": "tree-sha"}, status=201)
+
+        async def create_commit(request):
+            seen["commit"] = await request.json()
+            return web.json_response({"sha": "new-commit-sha"}, status=201)
+
+        async def update_ref(request):
+            seen["ref"] = await request.json()
+            return web.json_response({"object": {"sha": "new-commit-sha"}})
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(token="test-token", base_url=base_url) as service:
+                return await service.push_files_to_branch(
+                    "owner", "repo", "feature", {"a.txt": "A", "b.txt": "B"}, "Add files"
+                )
+
+        routes = [
+            web.get("/repos/owner/repo/git/ref/heads/feature", get_ref),
+            web.get("/repos/owner/repo/git/commits/head-sha", get_commit),
+            web.post("/repos/owner/repo/git/blobs", create_blob),
+            web.post("/repos/owner/repo/git/trees", create_tree),
+            web.post("/repos/owner/repo/git/commits", create_commit),
+            web.patch("/repos/owner/repo/git/refs/heads/feature", update_ref),
+        ]
+        result = run_with_server(routes, scenario)
+
+        assert result["commit_sha"] == "new-commit-sha"
+        assert result["files"] == ["a.txt", "b.txt"]
+        assert sorted(blobs) == ["A", "B"]
+        assert seen["tree"]["base_tree"] == "base-tree-sha"
+        assert [e["sha"] for e in seen["tree"]["tree"]] == ["blob-A", "blob-B"]
+        assert seen["commit"]["parents"] == ["head-sha"]
+        assert seen["ref"] == {"sha": "new-commit-sha"}
+
+    def test_http_error(self):
+        """Test that HTTP errors are raised."""
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(token="test-token", base_url=base_url) as service:
+                return await service.get_repository("owner", "missing")
+
+        with pytest.raises(aiohttp.ClientResponseError):
+            run_with_server([], scenario)
+
+
+class TestAsyncGitHubServiceHttpxTransport:
+    """Test the httpx (HTTP/2) transport against a local server."""
+
+    def test_unsupported_transport(self):
+        """Test that an unknown transport raises ValueError."""
+        with pytest.raises(ValueError, match="Unsupported transport"):
+            AsyncGitHubService(token="test-token", transport="urllib")
+
+    def test_get_pull_requests_fetches_all_pages(self):
+        """Test paginated listings over the httpx transport."""
+        pytest.importorskip("httpx")
+        seen = {}
+
+        async def handler(request):
+            seen["auth"] = request.headers.get("Authorization")
+            page = int(request.query["page"])
+            headers = {}
+            if page == 1:
+                headers["Link"] = f'<{request.url.with_query(page=2)}>; rel="last"'
+            return web.json_response([{"number": page}], headers=headers)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(
+                token="test-token", base_url=base_url, transport="httpx"
+            ) as service:
+                return await service.get_pull_requests("owner", "repo")
+
+        pulls = run_with_server([web.get("/repos/owner/repo/pulls", handler)], scenario)
+        assert pulls == [{"number": 1}, {"number": 2}]
+        assert seen["auth"] == "Bearer test-token"
+
+    def test_create_branch_already_exists(self):
+        """Test a 422 from ref creation raises ValueError over httpx."""
+        pytest.importorskip("httpx")
+
+        async def get_ref(request):
+            return web.json_response({"object": {"sha": "base-sha"}})
+
+        async def create_ref(request):
+            return web.json_response({"message": "Reference already exists"}, status=422)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(
+                token="test-token", base_url=base_url, transport="httpx"
+            ) as service:
+                return await service.create_branch("owner", "repo", "feature", "main")
+
+        routes = [
+            web.get("/repos/owner/repo/git/ref/heads/main", get_ref),
+            web.post("/repos/owner/repo/git/refs", create_ref),
+        ]
+        with pytest.raises(ValueError, match="already exists"):
+            run_with_server(routes, scenario)
+
+    def test_create_branch_invalid_ref_name(self):
+        """Test that other 422 validation errors are re-raised over httpx."""
+        httpx = pytest.importorskip("httpx")
+
+        async def get_ref(request):
+            return web.json_response({"object": {"sha": "base-sha"}})
+
+        async def create_ref(request):
+            return web.json_response({"message": "Reference name is invalid"}, status=422)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(
+                token="test-token", base_url=base_url, transport="httpx"
+            ) as service:
+                return await service.create_branch("owner", "repo", "a..b", "main")
+
+        routes = [
+            web.get("/repos/owner/repo/git/ref/heads/main", get_ref),
+            web.post("/repos/owner/repo/git/refs", create_ref),
+        ]
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            run_with_server(routes, scenario)
+        assert exc_info.value.response.status_code == 422
+
+    def test_delete_webhook_empty_response(self):
+        """Test an empty (204) response over httpx."""
+        pytest.importorskip("httpx")
+
+        async def handler(request):
+            return web.Response(status=204)
+
+        async def scenario(base_url):
+            async with AsyncGitHubService(
+                token="test-token", base_url=base_url, transport="httpx"
+            ) as service:
+                return await service.delete_webhook("owner", "repo", 123)
+
+        result = run_with_server([web.delete("/repos/owner/repo/hooks/123", handler)], scenario)
+        assert result is True